@@ -1,17 +1,57 @@
 """
 Finance 工作区配置 (Data Desk)
 """
+import functools
+import itertools
 import os
+import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
-# 项目根目录
-PROJECT_ROOT = Path(__file__).parent.parent
-
-# 自动加载 .env（API keys 等敏感配置）
-load_dotenv(PROJECT_ROOT / ".env")
-
-# 数据目录
+# 项目根目录 (os.path 字符串运算一次求出，避免 Path.parent 链式构造)
+_PROJECT_ROOT_STR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = Path(_PROJECT_ROOT_STR)
+
+# .env（API keys 等敏感配置）按需加载：只有读取的 key 不在进程环境中时才解析
+# 子进程继承 os.environ 中的标记 (值为 .env 的 mtime)，文件未变时跳过重复解析
+_DOTENV_LOADED_MARKER = "_SETTINGS_DOTENV_LOADED"
+
+# 从环境变量读取的配置项，经模块 __getattr__ 访问 (见文件末尾)
+_ENV_KEYS = frozenset({
+    "FMP_API_KEY",
+    "FINNHUB_API_KEY",
+    "REDDIT_CLIENT_ID",
+    "REDDIT_CLIENT_SECRET",
+    "TELEGRAM_BOT_TOKEN",
+    "TELEGRAM_CHAT_ID",
+    "FRED_API_KEY",
+})
+
+
+@functools.cache
+def _load_env() -> None:
+    """每个进程最多解析一次 .env；文件不存在直接返回。"""
+    env_path = os.path.join(_PROJECT_ROOT_STR, ".env")
+    try:
+        mtime = str(os.stat(env_path).st_mtime)
+    except FileNotFoundError:
+        return
+    if os.environ.get(_DOTENV_LOADED_MARKER) == mtime:
+        return
+    from dotenv import load_dotenv
+    load_dotenv(env_path, override=False)
+    os.environ[_DOTENV_LOADED_MARKER] = mtime
+
+
+def get_env(name: str) -> str:
+    """读取环境变量；进程环境中没有时先加载项目 .env 再查，仍没有返回空串。"""
+    value = os.environ.get(name)
+    if value is None:
+        _load_env()
+        value = os.environ.get(name, "")
+    return value
+
+# 数据目录 (import 时各构造一次；下游全部依赖 Path API: exists/glob/mkdir/`/`，
+# 因此保持 Path 而非 str。Path(os.path.join(...)) 实测比 `/` 更慢，不做替换)
 DATA_DIR = PROJECT_ROOT / "data"
 POOL_DIR = DATA_DIR / "pool"
 PRICE_DIR = DATA_DIR / "price"
@@ -19,8 +59,7 @@ FUNDAMENTAL_DIR = DATA_DIR / "fundamental"
 RATINGS_DIR = DATA_DIR / "ratings"
 MACRO_DIR = DATA_DIR / "macro"
 
-# FMP API 配置 (从环境变量读取)
-FMP_API_KEY = os.environ.get("FMP_API_KEY", "")
+# FMP API 配置 (FMP_API_KEY 从环境变量读取)
 FMP_BASE_URL = "https://financialmodelingprep.com/stable"
 
 # 股票池配置
@@ -31,7 +70,8 @@ EXCHANGES = ["NYSE", "NASDAQ"]  # 交易所过滤已足够，不再按注册国
 # 不维护 ALLOWED 白名单，只维护黑名单——新行业默认进入，需要排除时手动加入
 
 # 永久排除的股票 (不论市值和行业，永远不加入股票池)
-PERMANENTLY_EXCLUDED = {
+# frozenset + sys.intern: 只读常量，筛选热路径上的成员判断可走指针比较
+PERMANENTLY_EXCLUDED = frozenset(sys.intern(s) for s in (
     # 债券/优先股 (非普通股)
     "GEGGL", "BNJ", "BNH", "TBB",
     # 用户手动排除的应用软件
@@ -42,26 +82,27 @@ PERMANENTLY_EXCLUDED = {
     "UNP", "ADP",
     # 用户手动排除的医疗器械/军工
     "SYK", "NOC",
-}
+))
 
 # 永久排除的行业 (这些行业的股票永远不加入)
-EXCLUDED_SECTORS = [
+# frozenset: 只做成员判断；需要稳定顺序输出时用 sorted()
+EXCLUDED_SECTORS = frozenset({
     "Consumer Defensive",   # 必需消费
     "Energy",               # 能源
     "Utilities",            # 公用事业
     "Basic Materials",      # 基础材料
     "Real Estate",          # 房地产
-]
+})
 
 # 永久排除的细分行业
-EXCLUDED_INDUSTRIES = [
+EXCLUDED_INDUSTRIES = frozenset({
     "Telecommunications Services",  # 电信
     "Agricultural - Machinery",     # 农业机械
     "Conglomerates",               # 多元工业
     "Railroads",                   # 铁路
     "Industrial - Machinery",      # 工业机械
     "Staffing & Employment Services",  # 人力资源
-]
+})
 
 # API 调用配置 (防限流)
 API_CALL_INTERVAL = 2  # 秒，每次 API 调用间隔
@@ -80,10 +121,13 @@ DOLLAR_VOLUME_LOOKBACK = 30     # 新面孔回看天数
 # Benchmark symbols (always included in price updates)
 BENCHMARK_SYMBOLS = ["SPY", "QQQ"]
 
+# 配置自检 (import 时执行一次): 排除名单之间、以及与 benchmark 之间不得冲突
+assert not (EXCLUDED_SECTORS & EXCLUDED_INDUSTRIES), "行业与细分行业排除名单重叠"
+assert not (PERMANENTLY_EXCLUDED & set(BENCHMARK_SYMBOLS)), "benchmark 被列入永久排除"
+
 # ============ Attention Engine (Engine B) ============
 
-# Finnhub API (free tier: 60 req/min)
-FINNHUB_API_KEY = os.environ.get("FINNHUB_API_KEY", "")
+# Finnhub API (free tier: 60 req/min)，FINNHUB_API_KEY 从环境变量读取
 
 # Paths
 ATTENTION_DIR = DATA_DIR / "attention"
@@ -95,223 +139,39 @@ GT_ANCHOR_KEYWORD = "stock market"
 GT_SLEEP_SECONDS = 60  # 安全间隔（Google 限流严格）
 GT_DEFAULT_TIMEFRAME = "today 3-m"
 
-# Reddit (PRAW read-only OAuth)
-REDDIT_CLIENT_ID = os.environ.get("REDDIT_CLIENT_ID", "")
-REDDIT_CLIENT_SECRET = os.environ.get("REDDIT_CLIENT_SECRET", "")
+# Reddit (PRAW read-only OAuth)，REDDIT_CLIENT_ID / REDDIT_CLIENT_SECRET 从环境变量读取
 REDDIT_USER_AGENT = "attention-engine/1.0 by future-capital"
 REDDIT_SUBREDDITS = ["stocks", "investing", "wallstreetbets", "options"]
 REDDIT_POSTS_PER_SUB = 200
-REDDIT_TICKER_BLACKLIST = {
+# 按类别分组维护；合并时校验无重复，后续编辑出现重复条目会在 import 时直接失败
+_BLACKLIST_ENGLISH_WORDS = (
     "I", "A", "AM", "AT", "IT", "IS", "ON", "OR", "AN", "AS",
     "BE", "BY", "DO", "GO", "IF", "IN", "ME", "MY", "NO", "OF",
-    "OK", "SO", "TO", "UP", "US", "WE", "AI", "ALL", "CEO", "GDP",
-    "IMO", "IPO", "LOL", "OMG", "SEC", "USD", "WSB", "YOY", "DD",
-    "EPS", "ETF", "FED", "ATH", "OTC", "PE", "PS", "IV", "DTE",
-    "OP", "TD", "PM", "UK", "EU", "JP", "CN", "HK", "RIP", "FYI",
-    "TL", "DR", "TA", "FA", "IMF", "GDP", "CPI", "PPI", "NFP",
-}
-
-# 初始主题关键词（手动维护，~25 主题 120+ 关键词）
-THEME_KEYWORDS_SEED = {
-    # ===== AI 核心 =====
-    "ai_chip": {
-        "keywords": [
-            "AI chip", "GPU shortage", "AI accelerator", "AI semiconductor",
-            "NVIDIA GPU", "AI training chip", "inference chip",
-        ],
-        "tickers": ["NVDA", "AMD", "AVGO", "MRVL"],
-    },
-    "ai_software": {
-        "keywords": [
-            "generative AI", "large language model", "ChatGPT",
-            "AI copilot", "AI assistant", "enterprise AI",
-        ],
-        "tickers": ["MSFT", "GOOG", "META", "ORCL", "PLTR"],
-    },
-    "ai_agent": {
-        "keywords": [
-            "AI agent", "autonomous AI", "agentic AI",
-            "AI workflow automation", "AI coding",
-        ],
-        "tickers": ["MSFT", "GOOG", "AMZN", "PLTR", "CRM"],
-    },
-    "ai_infra": {
-        "keywords": [
-            "AI data center", "AI infrastructure", "hyperscaler capex",
-            "GPU cluster", "AI server", "AI power consumption",
-        ],
-        "tickers": ["NVDA", "AMD", "AVGO", "MRVL", "DELL", "AMZN", "MSFT", "GOOG"],
-    },
-    # ===== 半导体 =====
-    "memory": {
-        "keywords": [
-            "DRAM price", "HBM memory", "memory shortage", "NAND flash",
-            "HBM3E", "DRAM demand", "memory cycle",
-        ],
-        "tickers": ["MU", "WDC"],
-    },
-    "semicap": {
-        "keywords": [
-            "semiconductor equipment", "chip manufacturing",
-            "EUV lithography", "foundry expansion", "wafer fab",
-        ],
-        "tickers": ["ASML", "AMAT", "LRCX", "KLAC", "TSM"],
-    },
-    "chip_design": {
-        "keywords": [
-            "ARM architecture", "RISC-V", "custom silicon",
-            "edge AI chip", "mobile processor",
-        ],
-        "tickers": ["ARM", "QCOM", "AVGO", "MRVL"],
-    },
-    # ===== 数据中心 & 基建 =====
-    "liquid_cooling": {
-        "keywords": [
-            "liquid cooling", "data center cooling", "immersion cooling",
-            "direct-to-chip cooling", "thermal management",
-        ],
-        "tickers": ["NVDA", "DELL", "AMZN", "MSFT", "GOOG"],
-    },
-    "cloud": {
-        "keywords": [
-            "cloud computing", "cloud migration", "multi-cloud",
-            "AWS revenue", "Azure growth", "Google Cloud",
-        ],
-        "tickers": ["AMZN", "MSFT", "GOOG", "ORCL", "SNOW"],
-    },
-    "nuclear_power": {
-        "keywords": [
-            "small modular reactor", "nuclear data center",
-            "nuclear energy AI", "SMR nuclear",
-        ],
-        "tickers": ["AMZN", "MSFT", "GOOG"],
-    },
-    # ===== 网络安全 =====
-    "cybersecurity": {
-        "keywords": [
-            "cybersecurity", "zero trust", "ransomware",
-            "cloud security", "SASE", "XDR security",
-            "cybersecurity spending", "data breach",
-        ],
-        "tickers": ["CRWD", "PANW", "ZS", "FTNT"],
-    },
-    # ===== 自动驾驶 & 机器人 =====
-    "autonomous_driving": {
-        "keywords": [
-            "self driving car", "autonomous vehicle", "robotaxi",
-            "Tesla FSD", "Waymo", "lidar technology",
-        ],
-        "tickers": ["TSLA", "GOOG", "UBER"],
-    },
-    "humanoid_robot": {
-        "keywords": [
-            "humanoid robot", "Tesla Optimus", "Figure AI",
-            "robot automation", "industrial robot",
-        ],
-        "tickers": ["TSLA", "NVDA"],
-    },
-    # ===== 商业航天 =====
-    "space": {
-        "keywords": [
-            "commercial space", "SpaceX", "Starlink",
-            "satellite internet", "space economy",
-            "rocket launch", "space defense",
-        ],
-        "tickers": ["LMT", "RTX", "NOC", "BA"],
-    },
-    # ===== 量子计算 =====
-    "quantum": {
-        "keywords": [
-            "quantum computing", "quantum chip", "quantum supremacy",
-            "quantum error correction", "quantum advantage",
-        ],
-        "tickers": ["GOOG", "IBM", "IONQ"],
-    },
-    # ===== 消费科技 =====
-    "ar_vr": {
-        "keywords": [
-            "augmented reality", "virtual reality", "Apple Vision Pro",
-            "Meta Quest", "spatial computing", "mixed reality",
-        ],
-        "tickers": ["AAPL", "META"],
-    },
-    "streaming": {
-        "keywords": [
-            "streaming wars", "Netflix subscriber", "streaming revenue",
-            "ad-supported streaming", "content spending",
-        ],
-        "tickers": ["NFLX", "DIS", "AMZN"],
-    },
-    "digital_ads": {
-        "keywords": [
-            "digital advertising", "social media ads", "programmatic ads",
-            "ad revenue growth", "connected TV ads",
-        ],
-        "tickers": ["META", "GOOG", "TTD", "APP"],
-    },
-    # ===== 电动车 & 能源 =====
-    "ev_battery": {
-        "keywords": [
-            "electric vehicle sales", "EV battery", "EV charging",
-            "Tesla delivery", "EV market share",
-        ],
-        "tickers": ["TSLA"],
-    },
-    # ===== 金融科技 & 加密 =====
-    "fintech": {
-        "keywords": [
-            "digital payments", "fintech growth", "buy now pay later",
-            "payment processing", "embedded finance",
-        ],
-        "tickers": ["V", "MA", "PYPL", "SQ"],
-    },
-    "crypto": {
-        "keywords": [
-            "Bitcoin price", "Ethereum", "crypto regulation",
-            "Bitcoin ETF", "crypto exchange",
-        ],
-        "tickers": ["COIN"],
-    },
-    # ===== 医疗 =====
-    "glp1": {
-        "keywords": [
-            "GLP-1", "Ozempic", "weight loss drug",
-            "Wegovy", "Mounjaro", "obesity drug",
-        ],
-        "tickers": ["LLY", "NVO"],
-    },
-    "biotech": {
-        "keywords": [
-            "gene therapy", "CRISPR", "mRNA vaccine",
-            "biotech breakthrough", "FDA approval",
-        ],
-        "tickers": ["ABBV", "AMGN", "GILD", "REGN"],
-    },
-    # ===== 国防 =====
-    "defense": {
-        "keywords": [
-            "defense spending", "military AI", "drone warfare",
-            "defense budget", "defense contract",
-        ],
-        "tickers": ["LMT", "RTX", "NOC", "GD"],
-    },
-    # ===== 企业软件 =====
-    "enterprise_sw": {
-        "keywords": [
-            "SaaS growth", "enterprise software", "software spending",
-            "database market", "data analytics",
-        ],
-        "tickers": ["ORCL", "SNOW", "PLTR", "NOW"],
-    },
-    # ===== 中美科技 =====
-    "china_tech": {
-        "keywords": [
-            "chip export ban", "China AI", "US China tech war",
-            "semiconductor sanctions", "DeepSeek",
-        ],
-        "tickers": ["NVDA", "ASML", "AMAT", "LRCX"],
-    },
-}
+    "OK", "SO", "TO", "UP", "US", "WE", "ALL",
+)
+_BLACKLIST_INTERNET_SLANG = (
+    "IMO", "LOL", "OMG", "WSB", "DD", "RIP", "FYI", "TL", "DR", "OP",
+)
+_BLACKLIST_FINANCE_ACRONYMS = (
+    "AI", "CEO", "IPO", "SEC", "USD", "YOY", "EPS", "ETF", "FED", "ATH",
+    "OTC", "PE", "PS", "IV", "DTE", "TD", "PM", "TA", "FA",
+)
+_BLACKLIST_MACRO = ("GDP", "IMF", "CPI", "PPI", "NFP")
+_BLACKLIST_REGIONS = ("UK", "EU", "JP", "CN", "HK")
+
+_BLACKLIST_RAW = tuple(itertools.chain(
+    _BLACKLIST_ENGLISH_WORDS,
+    _BLACKLIST_INTERNET_SLANG,
+    _BLACKLIST_FINANCE_ACRONYMS,
+    _BLACKLIST_MACRO,
+    _BLACKLIST_REGIONS,
+))
+assert len(_BLACKLIST_RAW) == len(set(_BLACKLIST_RAW)), "REDDIT_TICKER_BLACKLIST 有重复条目"
+REDDIT_TICKER_BLACKLIST = frozenset(sys.intern(s) for s in _BLACKLIST_RAW)
+
+# 初始主题关键词 THEME_KEYWORDS_SEED 存放在 config/themes.json，
+# 倒排索引 TICKER_TO_THEMES ({ticker: frozenset(主题)}) 由其派生；
+# 两者均经模块 __getattr__ 按需加载 (见文件末尾)
 
 # 评分权重
 ATTENTION_WEIGHTS = {
@@ -345,6 +205,21 @@ THEME_MAX_NEW_TICKERS = 10                 # 每次池扩展最多新增几只
 THEME_RS_THRESHOLD = 80                    # RS 动量信号阈值 (百分位)
 POOL_SOURCE_ATTENTION = "attention"        # 注意力引擎来源标记
 
-# Telegram 配置 (从环境变量读取)
-TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN", "")
-TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID", "")
+# Telegram 配置: TELEGRAM_BOT_TOKEN / TELEGRAM_CHAT_ID 从环境变量读取
+
+
+# ============ 延迟加载 (PEP 562) ============
+
+def __getattr__(name):
+    # 环境变量类配置：读取时才触发 .env 解析 (python-dotenv 也延迟 import)
+    if name in _ENV_KEYS:
+        return get_env(name)
+    # 主题种子是 ~200 行字面量，只有 Attention / Theme 引擎用得到；
+    # Data Desk 脚本 import settings 时不再为它付出构造成本
+    if name == "THEME_KEYWORDS_SEED":
+        from config.themes import get_theme_keywords
+        return get_theme_keywords()
+    if name == "TICKER_TO_THEMES":
+        from config.themes import get_ticker_themes
+        return get_ticker_themes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,39 @@
+"""
+主题关键词种子 (Attention Engine / Theme Engine)
+
+种子数据 (~25 主题 120+ 关键词，手动维护) 存放在同目录 themes.json：
+    {theme: {"keywords": [...], "tickers": [...]}}
+
+由 config.settings 按需加载，通过 `from config.settings import THEME_KEYWORDS_SEED` 访问；
+只有 Attention / Theme 引擎会触发 JSON 解析。
+"""
+import functools
+import json
+import sys
+from pathlib import Path
+
+_THEMES_FILE = Path(__file__).with_name("themes.json")
+
+
+@functools.cache
+def get_theme_keywords() -> dict:
+    """解析 themes.json（每进程一次）。返回共享对象，调用方不得修改。
+
+    同一 ticker (NVDA/MSFT/GOOG...) 出现在十几个主题里，统一 sys.intern，
+    共享同一个 str 对象，下游集合运算可走指针比较。
+    """
+    seed = json.loads(_THEMES_FILE.read_bytes())
+    for info in seed.values():
+        info["tickers"] = [sys.intern(t) for t in info["tickers"]]
+        info["keywords"] = [sys.intern(k) for k in info["keywords"]]
+    return seed
+
+
+@functools.cache
+def get_ticker_themes() -> dict:
+    """倒排索引 {ticker: frozenset(主题名)}，由种子构建一次。"""
+    index: dict = {}
+    for theme, info in get_theme_keywords().items():
+        for ticker in info["tickers"]:
+            index.setdefault(ticker, set()).add(theme)
+    return {ticker: frozenset(themes) for ticker, themes in index.items()}
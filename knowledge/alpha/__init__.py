@@ -9,7 +9,7 @@ Alpha Layer — Layer 2 求导层 (Second-Order Thinking)
   B. Cycle & Pendulum — 情绪/商业/技术周期 + 逆向信号
   C. Asymmetric Bet — 构建可执行的交易结构 (最重要)
 """
-from knowledge.alpha.base import AlphaLens, AlphaPackage
+from knowledge.alpha.base import AlphaLens, AlphaPackage, ALPHA_LENSES, LENSES_BY_PHASE
 from knowledge.alpha.red_team import generate_red_team_prompt
 from knowledge.alpha.cycle_pendulum import generate_cycle_prompt
 from knowledge.alpha.asymmetric_bet import generate_bet_prompt
@@ -4,45 +4,10 @@
 索罗斯——不是学者索罗斯，是亲手按下"执行"按钮的交易员索罗斯。
 消费 Red Team + Cycle 输出，构建可执行的交易结构。
 """
+import functools
+import string
 
-
-def generate_bet_prompt(
-    symbol: str,
-    data_context: str,
-    red_team_summary: str,
-    cycle_summary: str,
-    l1_oprms: dict | None,
-    l1_verdict: str,
-    current_price: float | None,
-) -> str:
-    """
-    Generate the Asymmetric Bet prompt.
-
-    Args:
-        symbol: Ticker symbol
-        data_context: DataPackage.format_context() output
-        red_team_summary: Red Team Gauntlet output (Phase A)
-        cycle_summary: Cycle & Pendulum output (Phase B)
-        l1_oprms: Current OPRMS rating dict (or None)
-        l1_verdict: BUY/HOLD/SELL from L1
-        current_price: Latest stock price (or None)
-
-    Returns:
-        Fully rendered prompt string for Claude.
-    """
-    # Format OPRMS context
-    if l1_oprms:
-        oprms_block = (
-            f"- DNA: {l1_oprms.get('dna', 'N/A')} | Timing: {l1_oprms.get('timing', 'N/A')}\n"
-            f"- 时机系数: {l1_oprms.get('timing_coeff', 'N/A')}\n"
-            f"- 投资桶: {l1_oprms.get('investment_bucket', 'N/A')}"
-        )
-    else:
-        oprms_block = "- 无现有 OPRMS 评级"
-
-    price_block = f"${current_price:.2f}" if current_price else "N/A"
-
-    return f"""# 非对称赌注 — {symbol}
+_BET_TMPL = string.Template("""# 非对称赌注 — ${symbol}
 
 ## 你的身份
 
@@ -54,18 +19,18 @@ def generate_bet_prompt(
 现在轮到你了。你要回答最终的问题：**这个 risk 值不值得 take？如果值得，怎么 take？**
 
 ## 数据上下文
-{data_context}
+${data_context}
 
-## 当前价格: {price_block}
-## L1 结论: {l1_verdict}
+## 当前价格: ${price_block}
+## L1 结论: ${l1_verdict}
 ## 当前 OPRMS
-{oprms_block}
+${oprms_block}
 
 ## 红队攻击摘要（Phase A）
-{red_team_summary}
+${red_team_summary}
 
 ## 周期钟摆定位（Phase B）
-{cycle_summary}
+${cycle_summary}
 
 ## 你的决策任务（5 个维度）
 
@@ -88,7 +53,7 @@ def generate_bet_prompt(
 - 给出 conviction_modifier 的理由
 
 ### 3. 执行参数 (Execution Parameters)
-- **入场信号**: 什么条件出现时开始建仓？（不是"价格到 $XX"，是可观测的催化剂）
+- **入场信号**: 什么条件出现时开始建仓？（不是"价格到 $$XX"，是可观测的催化剂）
 - **加仓条件**: 什么信号确认论点正确，可以加仓？
 - **目标退出**: 什么条件出现时兑现收益？（可以是价格目标，但更重要的是论点验证）
 - **论点失效**: 什么条件出现时论点被证伪？（这不是止损价——是论点层面的失效信号）
@@ -112,7 +77,7 @@ def generate_bet_prompt(
 
 ## 输出格式
 
-### 🟢 非对称赌注报告 — {symbol}
+### 🟢 非对称赌注报告 — ${symbol}
 
 **核心洞见**: "市场认为 [X]，但真相是 [Y]，因为 [Z]"
 
@@ -136,4 +101,70 @@ def generate_bet_prompt(
 - 行动: [执行 / 搁置 / 放弃]
 - conviction_modifier: [X.X]
 - 最终仓位: [X]% of total capital
-- 一句话: [总结]"""
+- 一句话: [总结]""")
+
+# l1_oprms 中参与渲染的字段 (只取这些做缓存 key，评级 dict 里的 evidence 列表等不可哈希)
+_OPRMS_FIELDS = ("dna", "timing", "timing_coeff", "investment_bucket")
+# 与 _OPRMS_FIELDS 按位置对应
+_OPRMS_BLOCK = "- DNA: {} | Timing: {}\n- 时机系数: {}\n- 投资桶: {}"
+_NO_OPRMS_BLOCK = "- 无现有 OPRMS 评级"
+
+
+def generate_bet_prompt(
+    symbol: str,
+    data_context: str,
+    red_team_summary: str,
+    cycle_summary: str,
+    l1_oprms: dict | None,
+    l1_verdict: str,
+    current_price: float | None,
+) -> str:
+    """
+    Generate the Asymmetric Bet prompt.
+
+    Args:
+        symbol: Ticker symbol
+        data_context: DataPackage.format_context() output
+        red_team_summary: Red Team Gauntlet output (Phase A)
+        cycle_summary: Cycle & Pendulum output (Phase B)
+        l1_oprms: Current OPRMS rating dict (or None)
+        l1_verdict: BUY/HOLD/SELL from L1
+        current_price: Latest stock price (or None)
+
+    Returns:
+        Fully rendered prompt string for Claude.
+    """
+    oprms_values = (
+        tuple(l1_oprms.get(k, "N/A") for k in _OPRMS_FIELDS) if l1_oprms else None
+    )
+    return _render_bet_prompt(
+        symbol, data_context, red_team_summary, cycle_summary,
+        oprms_values, l1_verdict, current_price,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _render_bet_prompt(
+    symbol: str,
+    data_context: str,
+    red_team_summary: str,
+    cycle_summary: str,
+    oprms_values: tuple | None,
+    l1_verdict: str,
+    current_price: float | None,
+) -> str:
+    """Cached renderer — LLM 重试时相同输入直接复用已渲染的 prompt。"""
+    # Format OPRMS context
+    oprms_block = _OPRMS_BLOCK.format(*oprms_values) if oprms_values else _NO_OPRMS_BLOCK
+
+    price_block = f"${current_price:.2f}" if current_price else "N/A"
+
+    return _BET_TMPL.substitute(
+        symbol=symbol,
+        data_context=data_context,
+        price_block=price_block,
+        l1_verdict=l1_verdict,
+        oprms_block=oprms_block,
+        red_team_summary=red_team_summary,
+        cycle_summary=cycle_summary,
+    )
@@ -4,18 +4,32 @@ Alpha Layer — 数据结构
 AlphaLens: Layer 2 分析视角 (parallels InvestmentLens from L1)
 AlphaPackage: Layer 2 完整输出，持久化到 data/companies/{SYM}/analyses/
 """
-from dataclasses import dataclass, field
-from typing import List, Optional
+import json
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from typing import FrozenSet, List, Optional
 
+# Optional fast JSON encoder (serializes dataclasses directly, no intermediate dict)
+from src.json_codec import orjson
 
-@dataclass
+
+@dataclass(slots=True)
 class AlphaLens:
     """Layer 2 分析视角 (parallels InvestmentLens from L1)."""
     name: str           # e.g. "Red Team Gauntlet"
     name_cn: str        # e.g. "红队试炼"
     phase: int          # 1, 2, or 3
     persona: str        # Chinese persona description
-    tags: List[str] = field(default_factory=list)
+    tags: FrozenSet[str] = frozenset()
+
+    def __post_init__(self):
+        # Accept any iterable; store as frozenset of interned strings (O(1) membership)
+        self.tags = frozenset(sys.intern(t) for t in self.tags)
+
+
+def _intern(value):
+    """Intern short categorical strings so deserialized packages share them."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 # Pre-defined lenses for Layer 2
@@ -44,7 +58,11 @@ ALPHA_LENSES = [
 ]
 
 
-@dataclass
+# Phase → lens index (consumers look up by phase instead of scanning)
+LENSES_BY_PHASE = {lens.phase: lens for lens in ALPHA_LENSES}
+
+
+@dataclass(slots=True)
 class AlphaPackage:
     """Layer 2 output — persisted per-ticker."""
     symbol: str
@@ -79,64 +97,42 @@ class AlphaPackage:
     action: str = ""                         # 执行 / 搁置 / 放弃
 
     def to_dict(self) -> dict:
-        """Serialize to dict for JSON persistence."""
-        return {
-            "symbol": self.symbol,
-            "generated_at": self.generated_at,
-            # Red Team
-            "single_point_of_failure": self.single_point_of_failure,
-            "shadow_threat": self.shadow_threat,
-            "post_mortem": self.post_mortem,
-            "consensus_fragility": self.consensus_fragility,
-            # Cycle & Pendulum
-            "pendulum_score": self.pendulum_score,
-            "pendulum_direction": self.pendulum_direction,
-            "business_cycle_phase": self.business_cycle_phase,
-            "tech_cycle_phase": self.tech_cycle_phase,
-            "cycle_alignment": self.cycle_alignment,
-            "this_time_is_different": self.this_time_is_different,
-            # Asymmetric Bet
-            "core_insight": self.core_insight,
-            "bet_structure": self.bet_structure,
-            "entry_signal": self.entry_signal,
-            "target_exit": self.target_exit,
-            "thesis_invalidation": self.thesis_invalidation,
-            "noise_to_ignore": self.noise_to_ignore,
-            "real_danger_signals": self.real_danger_signals,
-            # Conviction
-            "conviction_level": self.conviction_level,
-            "conviction_modifier": self.conviction_modifier,
-            "action": self.action,
-        }
+        """Serialize to dict for JSON persistence (keys in field order)."""
+        return {name: getattr(self, name) for name in _ALPHA_PACKAGE_FIELDS}
+
+    def to_bytes(self) -> bytes:
+        """Serialize to indented UTF-8 JSON bytes (orjson when installed)."""
+        if orjson is not None:
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
 
     @classmethod
     def from_dict(cls, d: dict) -> "AlphaPackage":
-        """Deserialize from dict."""
-        return cls(
-            symbol=d.get("symbol", ""),
-            generated_at=d.get("generated_at", ""),
-            # Red Team
-            single_point_of_failure=d.get("single_point_of_failure", ""),
-            shadow_threat=d.get("shadow_threat", ""),
-            post_mortem=d.get("post_mortem", ""),
-            consensus_fragility=d.get("consensus_fragility", ""),
-            # Cycle & Pendulum
-            pendulum_score=d.get("pendulum_score"),
-            pendulum_direction=d.get("pendulum_direction", ""),
-            business_cycle_phase=d.get("business_cycle_phase", ""),
-            tech_cycle_phase=d.get("tech_cycle_phase", ""),
-            cycle_alignment=d.get("cycle_alignment", ""),
-            this_time_is_different=d.get("this_time_is_different", []),
-            # Asymmetric Bet
-            core_insight=d.get("core_insight", ""),
-            bet_structure=d.get("bet_structure", ""),
-            entry_signal=d.get("entry_signal", ""),
-            target_exit=d.get("target_exit", ""),
-            thesis_invalidation=d.get("thesis_invalidation", ""),
-            noise_to_ignore=d.get("noise_to_ignore", []),
-            real_danger_signals=d.get("real_danger_signals", []),
-            # Conviction
-            conviction_level=d.get("conviction_level", ""),
-            conviction_modifier=d.get("conviction_modifier", 1.0),
-            action=d.get("action", ""),
-        )
+        """Deserialize from dict (missing keys fall back to field defaults)."""
+        kwargs = {
+            name: d[name] if name in d else (factory() if factory is not None else default)
+            for name, default, factory in _ALPHA_PACKAGE_DEFAULTS
+        }
+        for name in _CATEGORICAL_FIELDS:
+            kwargs[name] = _intern(kwargs[name])
+        return cls(**kwargs)
+
+
+# Field metadata resolved once; to_dict / from_dict walk these instead of
+# hand-kept lists. default_factory is kept as a callable so every
+# deserialized package gets its own fresh list.
+_ALPHA_PACKAGE_FIELDS = tuple(f.name for f in fields(AlphaPackage))
+_ALPHA_PACKAGE_DEFAULTS = tuple(
+    (
+        f.name,
+        f.default if f.default is not MISSING else "",   # symbol: required → ""
+        f.default_factory if f.default_factory is not MISSING else None,
+    )
+    for f in fields(AlphaPackage)
+)
+
+# Small-vocabulary fields interned on deserialize
+_CATEGORICAL_FIELDS = (
+    "pendulum_direction", "business_cycle_phase", "tech_cycle_phase",
+    "cycle_alignment", "conviction_level", "action",
+)
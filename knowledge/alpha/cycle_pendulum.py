@@ -4,29 +4,10 @@
 霍华德·马克斯的门徒——看的不是公司，是人群围绕公司的行为。
 消费 Red Team 输出，注入宏观数据，定位当前周期位置。
 """
+import functools
+import string
 
-
-def generate_cycle_prompt(
-    symbol: str,
-    sector: str,
-    data_context: str,
-    red_team_summary: str,
-    macro_briefing: str,
-) -> str:
-    """
-    Generate the Cycle & Pendulum prompt.
-
-    Args:
-        symbol: Ticker symbol
-        sector: Company sector (e.g. "Technology")
-        data_context: DataPackage.format_context() output
-        red_team_summary: Red Team Gauntlet output (Phase A)
-        macro_briefing: Macro briefing narrative
-
-    Returns:
-        Fully rendered prompt string for Claude.
-    """
-    return f"""# 周期钟摆定位 — {symbol}
+_CYCLE_TMPL = string.Template("""# 周期钟摆定位 — ${symbol}
 
 ## 你的身份
 
@@ -34,22 +15,22 @@ def generate_cycle_prompt(
 你的核心信念：**市场的波动不是因为基本面变了，而是因为人们对基本面的态度变了。**
 你的工作不是预测未来，而是回答一个问题："现在的价格已经反映了多少乐观/悲观情绪？"
 
-你刚读完红队对 {symbol} 的摧毁性分析。你不会忽视那些攻击，也不会被它们吓住。
+你刚读完红队对 ${symbol} 的摧毁性分析。你不会忽视那些攻击，也不会被它们吓住。
 你要做的是：把红队的攻击放在周期的上下文中——这些风险是顺周期放大，还是逆周期缓冲？
 
 ## 数据上下文
-{data_context}
+${data_context}
 
 ## 宏观环境
-{macro_briefing}
+${macro_briefing}
 
 ## 红队攻击摘要（Phase A 输出）
-{red_team_summary}
+${red_team_summary}
 
 ## 你的分析任务（4 个维度）
 
 ### 1. 情绪钟摆 (Pendulum Score: 1-10)
-给 {symbol} 当前的市场情绪打分：1 = 极度恐惧（人人喊卖），10 = 极度贪婪（人人喊买）。
+给 ${symbol} 当前的市场情绪打分：1 = 极度恐惧（人人喊卖），10 = 极度贪婪（人人喊买）。
 **必须提供至少 3 个证据**，从以下维度中选择：
 - 分析师评级分布（Buy/Hold/Sell 比例，是否一边倒？）
 - 媒体叙事基调（恐惧/中性/兴奋/狂热？）
@@ -62,9 +43,9 @@ def generate_cycle_prompt(
 越接近极端，逆向操作的赔率越好。
 
 ### 2. 多维周期叠加
-三个周期同时作用于 {symbol}，判断它们是同向共振还是互相冲突：
+三个周期同时作用于 ${symbol}，判断它们是同向共振还是互相冲突：
 
-**商业/信贷周期**: {sector} 所处的经济周期阶段
+**商业/信贷周期**: ${sector} 所处的经济周期阶段
 - expansion → peak → contraction → trough → 哪个阶段？
 - 信贷条件对该公司的影响（利率敏感度、融资需求）
 
@@ -74,12 +55,12 @@ def generate_cycle_prompt(
 
 **监管/地缘周期**: 政策环境的方向
 - 宽松 vs 收紧？具体的监管变化或地缘风险
-- 对 {symbol} 的实质影响（不是泛泛的"地缘风险"）
+- 对 ${symbol} 的实质影响（不是泛泛的"地缘风险"）
 
 **周期对齐度**: tailwind（顺风）/ headwind（逆风）/ mixed（混合）
 
 ### 3. "这次不一样"陷阱
-列出 2-3 个当前市场用来辩护 {symbol} 估值/前景的主流论点。
+列出 2-3 个当前市场用来辩护 ${symbol} 估值/前景的主流论点。
 对每一个论点：
 - 找到历史上一个惊人相似但最终被证伪的案例（具体公司/时间/估值/结果）
 - 当时人们用几乎相同的语言辩护——结果如何？
@@ -92,7 +73,7 @@ def generate_cycle_prompt(
 
 ## 输出格式
 
-### 🔵 周期钟摆报告 — {symbol}
+### 🔵 周期钟摆报告 — ${symbol}
 
 **情绪钟摆**: X/10 — [一句话描述] | 方向: [toward_greed / toward_fear]
 证据:
@@ -115,5 +96,37 @@ def generate_cycle_prompt(
 - 拥挤方向: [描述]
 - 逆向触发: [具体条件]
 
-**周期结论**: {symbol} 当前处于 [周期位置描述]。
-红队攻击中的 [X] 风险在当前周期位置会被 [放大/缓冲]，因为 [原因]。"""
+**周期结论**: ${symbol} 当前处于 [周期位置描述]。
+红队攻击中的 [X] 风险在当前周期位置会被 [放大/缓冲]，因为 [原因]。""")
+
+
+@functools.lru_cache(maxsize=256)
+def generate_cycle_prompt(
+    symbol: str,
+    sector: str,
+    data_context: str,
+    red_team_summary: str,
+    macro_briefing: str,
+) -> str:
+    """
+    Generate the Cycle & Pendulum prompt.
+
+    Args:
+        symbol: Ticker symbol
+        sector: Company sector (e.g. "Technology")
+        data_context: DataPackage.format_context() output
+        red_team_summary: Red Team Gauntlet output (Phase A)
+        macro_briefing: Macro briefing narrative
+
+    Returns:
+        Fully rendered prompt string for Claude.
+        Pure function of its (string) arguments — cached so LLM retries
+        reuse the rendered prompt.
+    """
+    return _CYCLE_TMPL.substitute(
+        symbol=symbol,
+        sector=sector,
+        data_context=data_context,
+        macro_briefing=macro_briefing,
+        red_team_summary=red_team_summary,
+    )
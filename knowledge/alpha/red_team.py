@@ -4,8 +4,10 @@
 纯粹对抗性。不同于L1的平衡辩论（Bull AND Bear），红队只有一个任务：摧毁论点。
 用 Hindenburg Research 做空报告的语气。
 """
+import functools
 
 
+@functools.lru_cache(maxsize=256)
 def generate_red_team_prompt(
     symbol: str,
     memo_summary: str,
@@ -25,6 +27,9 @@ def generate_red_team_prompt(
 
     Returns:
         Fully rendered prompt string for Claude.
+        Pure function of its (string) arguments — cached so LLM retries
+        reuse the rendered prompt. The f-string is kept on purpose: it
+        renders faster than string.Template for this template.
     """
     return f"""# 红队试炼 — {symbol}
 
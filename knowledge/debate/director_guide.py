@@ -4,7 +4,9 @@ Research Director 主持指南
 Research Director 负责主持辩论、确保质量、防止群体思维、
 合成最终投资备忘录。
 """
-from typing import Dict, List
+import functools
+import string
+from dataclasses import dataclass
 
 
 # Director 角色定义
@@ -23,39 +25,47 @@ DIRECTOR_ROLE = {
     ],
 }
 
+@dataclass(frozen=True, slots=True)
+class InterventionTrigger:
+    """Director 干预触发条件"""
+    condition: str
+    description: str
+    action: str
+
+
 # 干预触发条件
-INTERVENTION_TRIGGERS = [
-    {
-        "condition": "Circular arguments",
-        "description": "Analysts repeat Round 1-2 arguments in Round 3-5 without new evidence",
-        "action": "Pause the debate. Restate what has been settled. Ask: 'What NEW evidence would change your view?'",
-    },
-    {
-        "condition": "Premature consensus",
-        "description": "All analysts agree too quickly (within 1-2 rounds) without stress-testing",
-        "action": "Assign devil's advocate role. Ask: 'If you had to SHORT this stock, what would your thesis be?'",
-    },
-    {
-        "condition": "Evidence-free claims",
-        "description": "Analyst makes strong claims without citing specific data, sources, or examples",
-        "action": "Flag the claim. Ask: 'What specific data point supports this? Cite a source.'",
-    },
-    {
-        "condition": "Talking past each other",
-        "description": "Analysts respond to strawman versions of each other's arguments",
-        "action": "Force direct engagement. Say: 'Analyst X, quote Analyst Y's exact claim and respond to THAT.'",
-    },
-    {
-        "condition": "Groupthink drift",
-        "description": "Minority view is being suppressed or ignored",
-        "action": "Elevate the dissenting view. Ask the dissenter to present their strongest evidence. Ask the majority to directly address it.",
-    },
-    {
-        "condition": "Scope creep",
-        "description": "Debate drifts to tangential topics unrelated to the 3 key tensions",
-        "action": "Redirect: 'We are here to resolve Tension X. Table that point for future research.'",
-    },
-]
+INTERVENTION_TRIGGERS: tuple[InterventionTrigger, ...] = (
+    InterventionTrigger(
+        condition="Circular arguments",
+        description="Analysts repeat Round 1-2 arguments in Round 3-5 without new evidence",
+        action="Pause the debate. Restate what has been settled. Ask: 'What NEW evidence would change your view?'",
+    ),
+    InterventionTrigger(
+        condition="Premature consensus",
+        description="All analysts agree too quickly (within 1-2 rounds) without stress-testing",
+        action="Assign devil's advocate role. Ask: 'If you had to SHORT this stock, what would your thesis be?'",
+    ),
+    InterventionTrigger(
+        condition="Evidence-free claims",
+        description="Analyst makes strong claims without citing specific data, sources, or examples",
+        action="Flag the claim. Ask: 'What specific data point supports this? Cite a source.'",
+    ),
+    InterventionTrigger(
+        condition="Talking past each other",
+        description="Analysts respond to strawman versions of each other's arguments",
+        action="Force direct engagement. Say: 'Analyst X, quote Analyst Y's exact claim and respond to THAT.'",
+    ),
+    InterventionTrigger(
+        condition="Groupthink drift",
+        description="Minority view is being suppressed or ignored",
+        action="Elevate the dissenting view. Ask the dissenter to present their strongest evidence. Ask the majority to directly address it.",
+    ),
+    InterventionTrigger(
+        condition="Scope creep",
+        description="Debate drifts to tangential topics unrelated to the 3 key tensions",
+        action="Redirect: 'We are here to resolve Tension X. Table that point for future research.'",
+    ),
+)
 
 # Director 各轮主持 prompt 模板
 MODERATION_PROMPTS = {
@@ -108,6 +118,13 @@ MODERATION_PROMPTS = {
     ),
 }
 
+# import 时预编译为 string.Template，get_director_prompt 每次调用不再重新解析格式串
+# (模板中只有 {ticker} 一个占位符，且不含 "$")
+_COMPILED_MODERATION_PROMPTS: dict[int, string.Template] = {
+    round_num: string.Template(template.replace("{ticker}", "${ticker}"))
+    for round_num, template in MODERATION_PROMPTS.items()
+}
+
 # 合成模板
 SYNTHESIS_TEMPLATE = """# Investment Memo Synthesis: {ticker}
 
@@ -145,6 +162,14 @@ SYNTHESIS_TEMPLATE = """# Investment Memo Synthesis: {ticker}
 {action_plan}
 """
 
+# SYNTHESIS_TEMPLATE 在 import 时解析一次为 (字面量, 字段名) 序列，渲染时直接拼接
+# (模板只用裸 {field}，没有格式说明符/转换，因此渲染时只需 str())
+_SYNTHESIS_PARTS = tuple(
+    (literal, field_name)
+    for literal, field_name, _spec, _conv in string.Formatter().parse(SYNTHESIS_TEMPLATE)
+)
+_SYNTHESIS_FIELDS = frozenset(name for _, name in _SYNTHESIS_PARTS if name)
+
 
 def get_director_prompt(ticker: str, round_num: int) -> str:
     """
@@ -157,14 +182,37 @@ def get_director_prompt(ticker: str, round_num: int) -> str:
     Returns:
         格式化的 prompt
     """
-    template = MODERATION_PROMPTS.get(round_num)
+    template = _COMPILED_MODERATION_PROMPTS.get(round_num)
     if template is None:
         raise ValueError(f"Invalid round number: {round_num}")
-    return template.format(ticker=ticker)
+    return template.substitute(ticker=ticker)
+
+
+def render_synthesis(**fields) -> str:
+    """
+    渲染合成备忘录 (等价于 SYNTHESIS_TEMPLATE.format(**fields))
+
+    Args:
+        **fields: SYNTHESIS_TEMPLATE 中的全部占位符 (ticker, analyst_rows, ...)
+
+    Returns:
+        markdown 格式的合成备忘录
+
+    Raises:
+        KeyError: 缺少占位符对应的字段
+    """
+    missing = _SYNTHESIS_FIELDS.difference(fields)
+    if missing:
+        raise KeyError(f"Missing synthesis fields: {sorted(missing)}")
+    return "".join(
+        literal + (str(fields[name]) if name else "")
+        for literal, name in _SYNTHESIS_PARTS
+    )
 
 
+@functools.cache
 def get_intervention_guide() -> str:
-    """返回干预指南的 markdown"""
+    """返回干预指南的 markdown (INTERVENTION_TRIGGERS 静态，首次调用后缓存)"""
     lines = [
         "# Director Intervention Guide",
         "",
@@ -172,5 +220,5 @@ def get_intervention_guide() -> str:
         "|---------|--------|",
     ]
     for trigger in INTERVENTION_TRIGGERS:
-        lines.append(f"| {trigger['condition']} | {trigger['action'][:80]}... |")
+        lines.append(f"| {trigger.condition} | {trigger.action[:80]}... |")
     return "\n".join(lines)
@@ -5,23 +5,23 @@
 - Round 1-2: Discovery — 广泛探索，每位分析师独立陈述
 - Round 3-5: Enrichment — 深化证据，解决张力，达成共识或明确分歧
 """
+import functools
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DebateRound:
     """单轮辩论定义"""
     round_number: int
     phase: str           # "discovery" | "enrichment"
     title: str
-    objectives: List[str]
+    objectives: list[str]
     analyst_instructions: str
     director_focus: str  # Research Director 本轮关注点
 
 
 # 5 轮辩论定义
-ROUNDS: List[DebateRound] = [
+ROUNDS: list[DebateRound] = [
     DebateRound(
         round_number=1,
         phase="discovery",
@@ -149,19 +149,24 @@ ROUNDS: List[DebateRound] = [
 ]
 
 
-def get_round(round_number: int) -> Optional[DebateRound]:
+# 轮次号 → 辩论定义 (import 时构建一次)
+_ROUNDS_BY_NUMBER: dict[int, DebateRound] = {r.round_number: r for r in ROUNDS}
+
+
+def get_round(round_number: int) -> DebateRound | None:
     """获取指定轮次的辩论定义"""
-    for r in ROUNDS:
-        if r.round_number == round_number:
-            return r
-    return None
+    return _ROUNDS_BY_NUMBER.get(round_number)
+
+
+# Round 3+ 尚未确定张力时的占位
+_DEFAULT_TENSIONS = ("[Tension 1 TBD]", "[Tension 2 TBD]", "[Tension 3 TBD]")
 
 
 def generate_round_prompt(
     round_num: int,
     ticker: str,
     lens_name: str = "",
-    tensions: Optional[List[str]] = None,
+    tensions: list[str] | None = None,
     previous_summary: str = "",
 ) -> str:
     """
@@ -181,45 +186,38 @@ def generate_round_prompt(
     if debate_round is None:
         raise ValueError(f"Invalid round number: {round_num}")
 
-    tensions = tensions or ["[Tension 1 TBD]", "[Tension 2 TBD]", "[Tension 3 TBD]"]
+    # 不足 3 个的张力用空串补齐
+    tension_1, tension_2, tension_3, *_ = (*(tensions or _DEFAULT_TENSIONS), "", "", "")
 
     instructions = debate_round.analyst_instructions.format(
         ticker=ticker,
         lens_name=lens_name,
-        tension_1=tensions[0] if len(tensions) > 0 else "",
-        tension_2=tensions[1] if len(tensions) > 1 else "",
-        tension_3=tensions[2] if len(tensions) > 2 else "",
+        tension_1=tension_1,
+        tension_2=tension_2,
+        tension_3=tension_3,
     )
 
     objectives_block = "\n".join(f"- {obj}" for obj in debate_round.objectives)
+    previous_block = (
+        f"## Previous Rounds Summary\n{previous_summary}\n\n" if previous_summary else ""
+    )
 
-    lines = [
-        f"# Round {round_num}: {debate_round.title}",
-        f"**Phase**: {debate_round.phase.title()} | **Ticker**: {ticker}",
-        "",
-        "## Objectives",
-        objectives_block,
-        "",
-    ]
-
-    if previous_summary:
-        lines.extend([
-            "## Previous Rounds Summary",
-            previous_summary,
-            "",
-        ])
-
-    lines.extend([
-        "## Your Instructions",
-        instructions,
-        "",
-    ])
-
-    return "\n".join(lines)
+    return (
+        f"# Round {round_num}: {debate_round.title}\n"
+        f"**Phase**: {debate_round.phase.title()} | **Ticker**: {ticker}\n"
+        f"\n"
+        f"## Objectives\n"
+        f"{objectives_block}\n"
+        f"\n"
+        f"{previous_block}"
+        f"## Your Instructions\n"
+        f"{instructions}\n"
+    )
 
 
+@functools.cache
 def get_protocol_summary() -> str:
-    """返回完整辩论协议的 markdown 概述"""
+    """返回完整辩论协议的 markdown 概述 (ROUNDS 静态，首次调用后缓存)"""
     lines = [
         "# Research Debate Protocol — 5 Rounds",
         "",
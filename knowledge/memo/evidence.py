@@ -6,7 +6,7 @@ Total sources: 8-10+
 """
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class EvidenceLevel(Enum):
@@ -45,7 +45,7 @@ PRIMARY_SOURCE_TYPES = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EvidenceItem:
     """单条证据"""
     source: str          # 来源描述
@@ -75,71 +75,110 @@ def validate_evidence_requirements(sources: List[EvidenceItem]) -> Dict:
             "issues": list of strings,
         }
     """
-    primary_count = sum(1 for s in sources if s.level == EvidenceLevel.PRIMARY)
-    total_count = len(sources)
+    primary_count = sum(s.level is EvidenceLevel.PRIMARY for s in sources)
+    return _evidence_validation(primary_count, len(sources))
+
+
+def _evidence_validation(primary_count: int, total_count: int) -> Dict:
+    """由计数构造 validate_evidence_requirements 的返回结构"""
+    primary_ok = primary_count >= 3
+    total_ok = total_count >= 8
 
     issues = []
-    if primary_count < 3:
+    if not primary_ok:
         issues.append(f"Need 3+ primary sources, have {primary_count}")
-    if total_count < 8:
+    if not total_ok:
         issues.append(f"Need 8+ total sources, have {total_count}")
 
     return {
         "total_count": total_count,
         "primary_count": primary_count,
-        "total_ok": total_count >= 8,
-        "primary_ok": primary_count >= 3,
-        "passed": primary_count >= 3 and total_count >= 8,
+        "total_ok": total_ok,
+        "primary_ok": primary_ok,
+        "passed": primary_ok and total_ok,
         "issues": issues,
     }
 
 
+# 渲染顺序及各层级段落标题
+_LEVEL_SECTIONS = (
+    (EvidenceLevel.PRIMARY, "Primary Sources (direct)"),
+    (EvidenceLevel.SECONDARY, "Secondary Sources (analyst/research)"),
+    (EvidenceLevel.TERTIARY, "Tertiary Sources (news/commentary)"),
+)
+
+
+@dataclass(slots=True)
+class EvidenceChain:
+    """
+    一组证据及其按层级分组的索引
+
+    分组和校验结果在构造时一次算好，之后重复 format() 只做渲染。
+    证据有增删时重新构造一个 EvidenceChain。
+    """
+    sources: Tuple[EvidenceItem, ...]
+    by_level: Dict[EvidenceLevel, List[EvidenceItem]] = field(init=False)
+    validation: Dict = field(init=False)
+
+    def __post_init__(self):
+        self.sources = tuple(self.sources)
+        # 一次遍历同时完成分组和计数，不再为校验重新扫描 sources
+        self.by_level = {}
+        primary_count = 0
+        for s in self.sources:
+            self.by_level.setdefault(s.level, []).append(s)
+            primary_count += s.level is EvidenceLevel.PRIMARY
+        self.validation = _evidence_validation(primary_count, len(self.sources))
+
+    def format(self) -> str:
+        """格式化证据链为 markdown"""
+        # 每个 level 段落、每条证据各拼成一个完整块，最后只做一次 join
+        sections = "".join(
+            f"### {label}\n"
+            + "".join(_format_evidence_item(i, item) for i, item in enumerate(items, 1))
+            for level, label in _LEVEL_SECTIONS
+            if (items := self.by_level.get(level))
+        )
+
+        # Summary
+        validation = self.validation
+        if validation["passed"]:
+            status, warnings = "PASS", ""
+        else:
+            status = "NEEDS MORE"
+            warnings = "".join(f"\n- WARNING: {issue}" for issue in validation["issues"])
+
+        return (
+            f"## Evidence Chain\n\n{sections}"
+            f"**Evidence Status**: {status} "
+            f"({validation['primary_count']} primary, "
+            f"{validation['total_count']} total){warnings}"
+        )
+
+
 def format_evidence_chain(sources: List[EvidenceItem]) -> str:
     """
     格式化证据链为 markdown
 
+    同一组证据需要反复渲染时，直接持有 EvidenceChain 并调用 format()。
+
     Args:
         sources: 证据列表
 
     Returns:
         格式化的 markdown 字符串
     """
-    lines = ["## Evidence Chain", ""]
-
-    # Group by level
-    by_level = {}
-    for s in sources:
-        by_level.setdefault(s.level, []).append(s)
-
-    level_order = [EvidenceLevel.PRIMARY, EvidenceLevel.SECONDARY, EvidenceLevel.TERTIARY]
-    level_labels = {
-        EvidenceLevel.PRIMARY: "Primary Sources (direct)",
-        EvidenceLevel.SECONDARY: "Secondary Sources (analyst/research)",
-        EvidenceLevel.TERTIARY: "Tertiary Sources (news/commentary)",
-    }
+    return EvidenceChain(sources).format()
+
+
+# 来源/摘要中的换行会打断列表项，"|" 会被渲染器当成表格分隔：单次 translate 处理
+_MD_ESCAPE = str.maketrans({"|": "\\|", "\n": " ", "\r": ""})
+
 
-    for level in level_order:
-        items = by_level.get(level, [])
-        if not items:
-            continue
-
-        lines.append(f"### {level_labels[level]}")
-        for i, item in enumerate(items, 1):
-            verified = " [verified]" if item.verified else ""
-            lines.append(f"{i}. **{item.source}** ({item.date}){verified}")
-            lines.append(f"   {item.content}")
-            if item.url:
-                lines.append(f"   Source: {item.url}")
-            lines.append("")
-
-    # Summary
-    validation = validate_evidence_requirements(sources)
-    status = "PASS" if validation["passed"] else "NEEDS MORE"
-    lines.append(f"**Evidence Status**: {status} "
-                 f"({validation['primary_count']} primary, "
-                 f"{validation['total_count']} total)")
-    if validation["issues"]:
-        for issue in validation["issues"]:
-            lines.append(f"- WARNING: {issue}")
-
-    return "\n".join(lines)
+def _format_evidence_item(i: int, item: EvidenceItem) -> str:
+    """单条证据的 markdown 块 (含末尾空行)"""
+    verified = " [verified]" if item.verified else ""
+    url = f"   Source: {item.url}\n" if item.url else ""
+    source = item.source.translate(_MD_ESCAPE)
+    content = item.content.translate(_MD_ESCAPE)
+    return f"{i}. **{source}** ({item.date}){verified}\n   {content}\n{url}\n"
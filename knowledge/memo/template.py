@@ -4,7 +4,7 @@
 每份备忘录必须包含: 变异观点、Kill Conditions、3 个关键张力、
 多种估值方法、带进出规则的行动价格。
 """
-from typing import List
+from typing import Dict, List
 
 
 # 四种投资桶分类
@@ -68,6 +68,157 @@ MEMO_SECTIONS = [
 ]
 
 
+# 各章节正文 (行列表)；executive_summary 含 {ticker}/{bucket} 占位符，其余为静态文本
+_TENSION_BODY = [
+    "### Tension {i}: [Question framing the debate]",
+    "**Case For**: [Strongest argument + evidence]",
+    "",
+    "**Case Against**: [Strongest counter-argument + evidence]",
+    "",
+    "**Resolution**: [What tipped the scales and why]",
+    "",
+]
+
+_SECTION_BODY_LINES: Dict[str, List[str]] = {
+    "executive_summary": [
+        "- **Ticker**: {ticker}",
+        "- **Bucket**: {bucket}",
+        "- **Variant View**: [One sentence: what the market believes vs. your view]",
+        "- **Target IRR**: [X%]",
+        "- **Action Price**: $[X] (current: $[Y])",
+        "- **Thesis**: [One paragraph falsifiable thesis]",
+        "",
+    ],
+    "variant_view": [
+        "### Market Consensus",
+        "[What does the market believe?]",
+        "",
+        "### Our View",
+        "[Why is the market wrong? What are we seeing that others miss?]",
+        "",
+        "### Evidence for Variant",
+        "1. [Primary evidence point]",
+        "2. [Primary evidence point]",
+        "3. [Primary evidence point]",
+        "",
+    ],
+    "thesis": [
+        "### Falsifiable Thesis Statement",
+        "[If X happens by Y date, then Z — otherwise we are wrong]",
+        "",
+        "### Three Key Forces",
+        "1. **[Force 1]**: [Description + evidence]",
+        "2. **[Force 2]**: [Description + evidence]",
+        "3. **[Force 3]**: [Description + evidence]",
+        "",
+    ],
+    "evidence": [
+        "### Primary Sources (3+ required)",
+        "1. [CEO interview / earnings call / direct data]",
+        "2. [Stakeholder signal / customer feedback]",
+        "3. [Behavioral data / patent / insider activity]",
+        "",
+        "### Secondary Sources",
+        "4. [Analyst report]",
+        "5. [Industry research]",
+        "...",
+        "",
+        "**Total sources**: [X] (minimum 8-10)",
+        "",
+    ],
+    "valuation": [
+        "### Method 1: DCF",
+        "| Assumption | Bear | Base | Bull |",
+        "|-----------|------|------|------|",
+        "| Revenue Growth | X% | Y% | Z% |",
+        "| Terminal Multiple | Xa | Ya | Za |",
+        "| **Fair Value** | $X | $Y | $Z |",
+        "",
+        "### Method 2: Comparable Companies",
+        "[EV/EBITDA, P/E, P/FCF vs peers]",
+        "",
+        "### Method 3: Reverse DCF",
+        "[What growth rate is implied by current price?]",
+        "",
+        "### IRR Calculation",
+        "- **Base case IRR**: X% (target: >= 15% long, >= 20-25% short)",
+        "- **Probability-weighted IRR**: Y%",
+        "",
+    ],
+    "tensions": [line.replace("{i}", str(i)) for i in range(1, 4) for line in _TENSION_BODY],
+    "risk_framework": [
+        "### Kill Conditions",
+        "1. **[Condition 1]**: [Observable, measurable trigger — NOT a calendar date]",
+        "2. **[Condition 2]**: [e.g., gross margin < 60% for 2 consecutive quarters]",
+        "3. **[Condition 3]**: [e.g., CEO departure, key customer loss]",
+        "",
+        "### Downside Scenarios",
+        "| Scenario | Probability | Price Target | Loss from Entry |",
+        "|----------|------------|-------------|----------------|",
+        "| Bear | X% | $Y | -Z% |",
+        "| Stress | X% | $Y | -Z% |",
+        "",
+        "### Position Sizing",
+        "- OPRMS DNA cap: [X%]",
+        "- Timing coefficient: [Y]",
+        "- Target position: [Z% of portfolio]",
+        "",
+    ],
+    "action_plan": [
+        "### Entry Rules",
+        "- Action price: $[X]",
+        "- Entry method: [Limit / scale-in / options]",
+        "- Initial size: [X% of target, scale to full on confirmation]",
+        "",
+        "### Exit Rules",
+        "- Target exit: $[X] ([Y%] upside)",
+        "- Stop loss: $[X] ([Y%] downside)",
+        "- Time stop: [Review if thesis not confirmed by DATE]",
+        "",
+        "### Observable Milestones",
+        "| Milestone | Expected By | Status |",
+        "|-----------|------------|--------|",
+        "| [Milestone 1] | [Date] | Pending |",
+        "| [Milestone 2] | [Date] | Pending |",
+        "",
+        "### Review Cadence",
+        "- Weekly: price action + news scan",
+        "- Monthly: thesis validation check",
+        "- Quarterly: full re-underwriting post earnings",
+        "",
+    ],
+}
+
+# Writing standards reminder
+_WRITING_STANDARDS_FOOTER = "\n".join([
+    "## Writing Standards Checklist",
+    "- [ ] 80%+ active voice",
+    "- [ ] No hedge words on beliefs (remove: might, could, perhaps, arguably)",
+    "- [ ] One idea per paragraph",
+    "- [ ] Topic sentences first",
+    "- [ ] 12,000-20,000 characters of substantive analysis",
+    "- [ ] All evidence fact-checked and sourced",
+    "- [ ] Target memo score: > 7.0/10",
+])
+
+
+def _section_block(section: dict) -> str:
+    """单个章节的完整 markdown 块 (标题 + 说明 + 正文 + 分隔线)"""
+    return "\n".join([
+        f"## {section['title']}",
+        "",
+        f"*{section['description']}*",
+        "",
+        *_SECTION_BODY_LINES.get(section["id"], []),
+        "---",
+        "",
+    ])
+
+
+# 章节块在 import 时拼好；只有 executive_summary 需要在调用时填入 ticker/bucket
+_SECTION_BLOCKS = [_section_block(section) for section in MEMO_SECTIONS]
+
+
 def generate_memo_skeleton(ticker: str, bucket: str) -> str:
     """
     生成投资备忘录的 markdown 骨架
@@ -79,165 +230,22 @@ def generate_memo_skeleton(ticker: str, bucket: str) -> str:
     Returns:
         带所有必需章节的 markdown 模板
     """
-    lines = [
-        f"# Investment Memo: {ticker}",
-        "",
-        f"**Investment Bucket**: {bucket}",
-        f"**Date**: [YYYY-MM-DD]",
-        f"**Analyst**: [Name]",
-        f"**OPRMS Rating**: DNA [S/A/B/C] | Timing [S/A/B/C] | Coeff [X.X]",
-        "",
-        "---",
-        "",
-    ]
-
-    for section in MEMO_SECTIONS:
-        lines.append(f"## {section['title']}")
-        lines.append("")
-        lines.append(f"*{section['description']}*")
-        lines.append("")
-
-        if section["id"] == "executive_summary":
-            lines.extend([
-                f"- **Ticker**: {ticker}",
-                f"- **Bucket**: {bucket}",
-                "- **Variant View**: [One sentence: what the market believes vs. your view]",
-                "- **Target IRR**: [X%]",
-                "- **Action Price**: $[X] (current: $[Y])",
-                "- **Thesis**: [One paragraph falsifiable thesis]",
-                "",
-            ])
-        elif section["id"] == "variant_view":
-            lines.extend([
-                "### Market Consensus",
-                "[What does the market believe?]",
-                "",
-                "### Our View",
-                "[Why is the market wrong? What are we seeing that others miss?]",
-                "",
-                "### Evidence for Variant",
-                "1. [Primary evidence point]",
-                "2. [Primary evidence point]",
-                "3. [Primary evidence point]",
-                "",
-            ])
-        elif section["id"] == "thesis":
-            lines.extend([
-                "### Falsifiable Thesis Statement",
-                "[If X happens by Y date, then Z — otherwise we are wrong]",
-                "",
-                "### Three Key Forces",
-                "1. **[Force 1]**: [Description + evidence]",
-                "2. **[Force 2]**: [Description + evidence]",
-                "3. **[Force 3]**: [Description + evidence]",
-                "",
-            ])
-        elif section["id"] == "evidence":
-            lines.extend([
-                "### Primary Sources (3+ required)",
-                "1. [CEO interview / earnings call / direct data]",
-                "2. [Stakeholder signal / customer feedback]",
-                "3. [Behavioral data / patent / insider activity]",
-                "",
-                "### Secondary Sources",
-                "4. [Analyst report]",
-                "5. [Industry research]",
-                "...",
-                "",
-                "**Total sources**: [X] (minimum 8-10)",
-                "",
-            ])
-        elif section["id"] == "valuation":
-            lines.extend([
-                "### Method 1: DCF",
-                "| Assumption | Bear | Base | Bull |",
-                "|-----------|------|------|------|",
-                "| Revenue Growth | X% | Y% | Z% |",
-                "| Terminal Multiple | Xa | Ya | Za |",
-                "| **Fair Value** | $X | $Y | $Z |",
-                "",
-                "### Method 2: Comparable Companies",
-                "[EV/EBITDA, P/E, P/FCF vs peers]",
-                "",
-                "### Method 3: Reverse DCF",
-                "[What growth rate is implied by current price?]",
-                "",
-                "### IRR Calculation",
-                "- **Base case IRR**: X% (target: >= 15% long, >= 20-25% short)",
-                "- **Probability-weighted IRR**: Y%",
-                "",
-            ])
-        elif section["id"] == "tensions":
-            for i in range(1, 4):
-                lines.extend([
-                    f"### Tension {i}: [Question framing the debate]",
-                    f"**Case For**: [Strongest argument + evidence]",
-                    "",
-                    f"**Case Against**: [Strongest counter-argument + evidence]",
-                    "",
-                    f"**Resolution**: [What tipped the scales and why]",
-                    "",
-                ])
-        elif section["id"] == "risk_framework":
-            lines.extend([
-                "### Kill Conditions",
-                "1. **[Condition 1]**: [Observable, measurable trigger — NOT a calendar date]",
-                "2. **[Condition 2]**: [e.g., gross margin < 60% for 2 consecutive quarters]",
-                "3. **[Condition 3]**: [e.g., CEO departure, key customer loss]",
-                "",
-                "### Downside Scenarios",
-                "| Scenario | Probability | Price Target | Loss from Entry |",
-                "|----------|------------|-------------|----------------|",
-                "| Bear | X% | $Y | -Z% |",
-                "| Stress | X% | $Y | -Z% |",
-                "",
-                "### Position Sizing",
-                "- OPRMS DNA cap: [X%]",
-                "- Timing coefficient: [Y]",
-                "- Target position: [Z% of portfolio]",
-                "",
-            ])
-        elif section["id"] == "action_plan":
-            lines.extend([
-                "### Entry Rules",
-                "- Action price: $[X]",
-                "- Entry method: [Limit / scale-in / options]",
-                "- Initial size: [X% of target, scale to full on confirmation]",
-                "",
-                "### Exit Rules",
-                "- Target exit: $[X] ([Y%] upside)",
-                "- Stop loss: $[X] ([Y%] downside)",
-                "- Time stop: [Review if thesis not confirmed by DATE]",
-                "",
-                "### Observable Milestones",
-                "| Milestone | Expected By | Status |",
-                "|-----------|------------|--------|",
-                "| [Milestone 1] | [Date] | Pending |",
-                "| [Milestone 2] | [Date] | Pending |",
-                "",
-                "### Review Cadence",
-                "- Weekly: price action + news scan",
-                "- Monthly: thesis validation check",
-                "- Quarterly: full re-underwriting post earnings",
-                "",
-            ])
-
-        lines.append("---")
-        lines.append("")
-
-    # Writing standards reminder
-    lines.extend([
-        "## Writing Standards Checklist",
-        "- [ ] 80%+ active voice",
-        "- [ ] No hedge words on beliefs (remove: might, could, perhaps, arguably)",
-        "- [ ] One idea per paragraph",
-        "- [ ] Topic sentences first",
-        "- [ ] 12,000-20,000 characters of substantive analysis",
-        "- [ ] All evidence fact-checked and sourced",
-        f"- [ ] Target memo score: > 7.0/10",
-    ])
-
-    return "\n".join(lines)
+    header = (
+        f"# Investment Memo: {ticker}\n"
+        f"\n"
+        f"**Investment Bucket**: {bucket}\n"
+        f"**Date**: [YYYY-MM-DD]\n"
+        f"**Analyst**: [Name]\n"
+        f"**OPRMS Rating**: DNA [S/A/B/C] | Timing [S/A/B/C] | Coeff [X.X]\n"
+        f"\n"
+        f"---\n"
+    )
+    sections = "\n".join(
+        block.format(ticker=ticker, bucket=bucket)
+        if section["id"] == "executive_summary" else block
+        for section, block in zip(MEMO_SECTIONS, _SECTION_BLOCKS)
+    )
+    return f"{header}\n{sections}\n{_WRITING_STANDARDS_FOOTER}"
 
 
 def get_section_names() -> List[str]:
@@ -5,15 +5,19 @@ OPRMS 评级变更日志 — 带证据追踪
 """
 import json
 import logging
-from dataclasses import dataclass, field
+import operator
+import os
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+from src.json_codec import json_loads, orjson
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RatingChange:
     """单次评级变更记录"""
     symbol: str
@@ -39,6 +43,12 @@ class RatingChange:
 
     @classmethod
     def from_dict(cls, d: dict) -> "RatingChange":
+        try:
+            # 完整记录 (log_rating_change 写出的格式) 一次 itemgetter 取齐全部字段按位构造
+            return cls(*_get_all_fields(d))
+        except KeyError:
+            pass
+        # 旧记录可能缺少可选字段：逐项取默认值
         return cls(
             symbol=d["symbol"],
             field_changed=d["field_changed"],
@@ -51,23 +61,50 @@ class RatingChange:
         )
 
 
-def log_rating_change(change: RatingChange, log_path: Path) -> None:
+# 按 RatingChange 字段定义顺序一次取出全部值，供 from_dict 快速路径使用
+_get_all_fields = operator.itemgetter(*(f.name for f in fields(RatingChange)))
+
+
+def _dump_line(change: RatingChange) -> bytes:
+    """单条变更记录 → 一行 UTF-8 JSON (含换行)；orjson 可用时用它序列化"""
+    if orjson is not None:
+        return orjson.dumps(change.to_dict(), option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(change.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def log_rating_changes(changes: Iterable[RatingChange], log_path: Path) -> None:
     """
-    追加变更记录到 JSONL 文件
+    批量追加变更记录到 JSONL 文件 (只打开文件一次、一次写入)
 
     Args:
-        change: 变更记录
+        changes: 变更记录
         log_path: JSONL 文件路径
     """
+    changes = list(changes)
+    if not changes:
+        return
+
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(change.to_dict(), ensure_ascii=False) + "\n")
+    with open(log_path, "ab") as f:
+        f.write(b"".join(_dump_line(change) for change in changes))
+
+    for change in changes:
+        logger.info(
+            f"评级变更: {change.symbol} {change.field_changed} "
+            f"{change.old_value} → {change.new_value}"
+        )
 
-    logger.info(
-        f"评级变更: {change.symbol} {change.field_changed} "
-        f"{change.old_value} → {change.new_value}"
-    )
+
+def log_rating_change(change: RatingChange, log_path: Path) -> None:
+    """
+    追加变更记录到 JSONL 文件
+
+    Args:
+        change: 变更记录
+        log_path: JSONL 文件路径
+    """
+    log_rating_changes((change,), log_path)
 
 
 def get_rating_history(
@@ -89,30 +126,65 @@ def get_rating_history(
     if not log_path.exists():
         return []
 
+    # 子串预筛：目标记录的 JSON 行必然包含带引号的 symbol，其余行不做 JSON 解析
+    # (与分隔符风格无关，紧凑/带空格写法都能命中)
+    needle = json.dumps(symbol, ensure_ascii=False)
+
     changes = []
     with open(log_path, "r", encoding="utf-8") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if needle not in line:
                 continue
             try:
-                d = json.loads(line)
-                if d["symbol"] == symbol:
-                    if field_changed is None or d["field_changed"] == field_changed:
-                        changes.append(RatingChange.from_dict(d))
-            except (json.JSONDecodeError, KeyError) as e:
+                d = json_loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"解析变更记录失败: {e}")
+                continue
+            # 先用 .get 过滤，只为命中的记录构造 RatingChange
+            if d.get("symbol") != symbol:
+                continue
+            if field_changed is not None and d.get("field_changed") != field_changed:
+                continue
+            try:
+                changes.append(RatingChange.from_dict(d))
+            except KeyError as e:
                 logger.warning(f"解析变更记录失败: {e}")
 
     return sorted(changes, key=lambda c: c.changed_at)
 
 
-def get_all_changes(log_path: Path, limit: int = 50) -> List[RatingChange]:
+def _reverse_lines(path: Path, block_size: int = 8192) -> Iterator[bytes]:
+    """从文件末尾按块倒读，逐行 yield (不含换行符，UTF-8 按 b"\\n" 切分是安全的)"""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        tail = b""
+        while pos > 0:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            lines = (f.read(read_size) + tail).split(b"\n")
+            # 第一段可能是被块边界截断的半行，留到下一块拼接
+            tail = lines.pop(0)
+            yield from reversed(lines)
+        yield tail
+
+
+def get_all_changes(
+    log_path: Path,
+    limit: int = 50,
+    strict_order: bool = False,
+) -> List[RatingChange]:
     """
     获取最近的所有变更记录
 
+    日志只追加写入，默认从文件尾部倒读，取到 limit 条有效记录即停止。
+    若日志中存在补录等时间戳乱序的记录，传 strict_order=True 全量扫描后按时间排序。
+
     Args:
         log_path: JSONL 文件路径
         limit: 最多返回条数
+        strict_order: 是否全量扫描并严格按 changed_at 排序
 
     Returns:
         按时间倒序排列的变更记录
@@ -120,16 +192,22 @@ def get_all_changes(log_path: Path, limit: int = 50) -> List[RatingChange]:
     if not log_path.exists():
         return []
 
+    if strict_order:
+        with open(log_path, "rb") as f:
+            lines = f.read().splitlines()
+    else:
+        lines = _reverse_lines(log_path)
+
     changes = []
-    with open(log_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                changes.append(RatingChange.from_dict(json.loads(line)))
-            except (json.JSONDecodeError, KeyError):
-                continue
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            changes.append(RatingChange.from_dict(json_loads(line)))
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
+            continue
+        if not strict_order and len(changes) >= limit:
+            break
 
     changes.sort(key=lambda c: c.changed_at, reverse=True)
     return changes[:limit]
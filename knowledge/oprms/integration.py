@@ -39,6 +39,15 @@ PORTFOLIO_SCHEMA = {
 }
 
 
+# validate_rating_data 用到的合法值/系数范围 (import 时构建一次)
+_VALID_DNA = frozenset(r.value for r in DNARating)
+_TIMING_RANGES = {r.value: r.coefficient_range for r in TimingRating}
+_VALID_BUCKETS = frozenset(
+    PORTFOLIO_SCHEMA["fields"]["investment_bucket"]["enum"]
+    + [""]  # allow empty during initial setup
+)
+
+
 def export_for_portfolio(ratings: Dict[str, OPRMSRating]) -> Dict:
     """
     导出评级数据为 Portfolio Desk 格式
@@ -51,11 +60,13 @@ def export_for_portfolio(ratings: Dict[str, OPRMSRating]) -> Dict:
     """
     exports = []
     for symbol, rating in sorted(ratings.items()):
-        target_weight = rating.dna.max_position_pct * rating.timing_coeff
+        # 上限只取一次：target_weight 和 dna_max_position_pct 共用
+        max_position_pct = rating.dna.max_position_pct
+        target_weight = max_position_pct * rating.timing_coeff
         exports.append({
             "symbol": symbol,
             "dna": rating.dna.value,
-            "dna_max_position_pct": round(rating.dna.max_position_pct * 100, 2),
+            "dna_max_position_pct": round(max_position_pct * 100, 2),
             "timing": rating.timing.value,
             "timing_coeff": rating.timing_coeff,
             "target_weight_pct": round(target_weight * 100, 2),
@@ -82,15 +93,6 @@ def validate_rating_data(data: dict) -> List[str]:
         错误列表 (空列表 = 通过)
     """
     errors = []
-    valid_dna = {r.value for r in DNARating}
-    valid_timing = {r.value for r in TimingRating}
-    valid_buckets = {
-        "Long-term Compounder",
-        "Catalyst-Driven Long",
-        "Short Position",
-        "Secular Short",
-        "",  # allow empty during initial setup
-    }
 
     if "positions" not in data:
         errors.append("Missing 'positions' key")
@@ -105,25 +107,24 @@ def validate_rating_data(data: dict) -> List[str]:
 
         sym = pos["symbol"]
 
-        if pos.get("dna") not in valid_dna:
-            errors.append(f"{sym}: invalid dna '{pos.get('dna')}'")
-
-        if pos.get("timing") not in valid_timing:
-            errors.append(f"{sym}: invalid timing '{pos.get('timing')}'")
-
-        coeff = pos.get("timing_coeff")
-        if coeff is not None:
-            timing = pos.get("timing")
-            if timing in valid_timing:
-                tr = TimingRating(timing)
-                lo, hi = tr.coefficient_range
-                if not (lo <= coeff <= hi):
-                    errors.append(
-                        f"{sym}: timing_coeff {coeff} out of range [{lo}, {hi}] for {timing}"
-                    )
+        dna = pos.get("dna")
+        if dna not in _VALID_DNA:
+            errors.append(f"{sym}: invalid dna '{dna}'")
+
+        timing = pos.get("timing")
+        coeff_range = _TIMING_RANGES.get(timing)
+        if coeff_range is None:
+            errors.append(f"{sym}: invalid timing '{timing}'")
+        else:
+            coeff = pos.get("timing_coeff")
+            lo, hi = coeff_range
+            if coeff is not None and not (lo <= coeff <= hi):
+                errors.append(
+                    f"{sym}: timing_coeff {coeff} out of range [{lo}, {hi}] for {timing}"
+                )
 
         bucket = pos.get("investment_bucket", "")
-        if bucket not in valid_buckets:
+        if bucket not in _VALID_BUCKETS:
             errors.append(f"{sym}: invalid investment_bucket '{bucket}'")
 
     return errors
@@ -23,21 +23,26 @@ class DNARating(Enum):
     @property
     def max_position_pct(self) -> float:
         """仓位上限百分比 (占总资产)"""
-        return {
-            DNARating.S: 0.25,
-            DNARating.A: 0.15,
-            DNARating.B: 0.07,
-            DNARating.C: 0.02,
-        }[self]
+        return _DNA_MAX_POSITION_PCT[self]
 
     @property
     def label(self) -> str:
-        return {
-            DNARating.S: "圣杯",
-            DNARating.A: "猛将",
-            DNARating.B: "黑马",
-            DNARating.C: "跟班",
-        }[self]
+        return _DNA_LABELS[self]
+
+
+# DNARating 属性查找表 (Enum 成员定义完成后构建，属性访问不再每次新建 dict)
+_DNA_MAX_POSITION_PCT = {
+    DNARating.S: 0.25,
+    DNARating.A: 0.15,
+    DNARating.B: 0.07,
+    DNARating.C: 0.02,
+}
+_DNA_LABELS = {
+    DNARating.S: "圣杯",
+    DNARating.A: "猛将",
+    DNARating.B: "黑马",
+    DNARating.C: "跟班",
+}
 
 
 class TimingRating(Enum):
@@ -54,30 +59,44 @@ class TimingRating(Enum):
     @property
     def coefficient_range(self) -> Tuple[float, float]:
         """时机系数范围 (min, max)"""
-        return {
-            TimingRating.S: (1.0, 1.5),
-            TimingRating.A: (0.8, 1.0),
-            TimingRating.B: (0.4, 0.6),
-            TimingRating.C: (0.1, 0.3),
-        }[self]
+        return _TIMING_COEFFICIENT_RANGES[self]
 
     @property
     def midpoint(self) -> float:
         """系数范围中点"""
-        lo, hi = self.coefficient_range
-        return (lo + hi) / 2
+        return _TIMING_MIDPOINTS[self]
 
     @property
     def label(self) -> str:
-        return {
-            TimingRating.S: "千载难逢",
-            TimingRating.A: "趋势确立",
-            TimingRating.B: "正常波动",
-            TimingRating.C: "垃圾时间",
-        }[self]
-
-
-@dataclass
+        return _TIMING_LABELS[self]
+
+
+# TimingRating 属性查找表
+_TIMING_COEFFICIENT_RANGES = {
+    TimingRating.S: (1.0, 1.5),
+    TimingRating.A: (0.8, 1.0),
+    TimingRating.B: (0.4, 0.6),
+    TimingRating.C: (0.1, 0.3),
+}
+_TIMING_MIDPOINTS = {t: (lo + hi) / 2 for t, (lo, hi) in _TIMING_COEFFICIENT_RANGES.items()}
+_TIMING_LABELS = {
+    TimingRating.S: "千载难逢",
+    TimingRating.A: "趋势确立",
+    TimingRating.B: "正常波动",
+    TimingRating.C: "垃圾时间",
+}
+
+# 仓位计算热路径用的成员普通属性 (_cap / _mid / _range)：
+# 一次实例属性读取，绕过 property 描述符调用 + 查表
+for _dna in DNARating:
+    _dna._cap = _DNA_MAX_POSITION_PCT[_dna]
+for _timing in TimingRating:
+    _timing._mid = _TIMING_MIDPOINTS[_timing]
+    _timing._range = _TIMING_COEFFICIENT_RANGES[_timing]
+del _dna, _timing
+
+
+@dataclass(slots=True)
 class OPRMSRating:
     """单只股票的 OPRMS 评级"""
     symbol: str
@@ -112,7 +131,7 @@ class OPRMSRating:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSize:
     """仓位计算结果"""
     symbol: str
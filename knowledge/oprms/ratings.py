@@ -3,10 +3,16 @@ OPRMS 评级引擎 — 核心仓位计算
 
 核心公式: 最终仓位 = 总资产 x DNA上限 x Timing系数
 """
+import dataclasses
+import functools
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from knowledge.oprms.models import (
     DNARating,
@@ -14,9 +20,18 @@ from knowledge.oprms.models import (
     OPRMSRating,
     PositionSize,
 )
+from src.json_codec import json_loads, orjson
 
 logger = logging.getLogger(__name__)
 
+# 灵敏度表的固定轴 (import 时构建一次): DNA 上限向量 x Timing 中点向量
+_DNA_AXIS = tuple(DNARating)
+_TIMING_AXIS = tuple(TimingRating)
+_DNA_CAPS = np.array([d.max_position_pct for d in _DNA_AXIS])
+_COEFFS = np.array([t.midpoint for t in _TIMING_AXIS])
+_COEFF_LIST = _COEFFS.tolist()
+_DNA_CAP_PCT_ROUNDED = [round(cap * 100, 1) for cap in _DNA_CAPS.tolist()]
+
 
 def calculate_position_size(
     total_capital: float,
@@ -39,16 +54,17 @@ def calculate_position_size(
     Raises:
         ValueError: timing_coeff 超出评级允许范围
     """
+    # _mid / _range / _cap 是 models 中绑定在枚举成员上的普通属性
     if timing_coeff is None:
-        timing_coeff = timing.midpoint
+        timing_coeff = timing._mid
     else:
-        lo, hi = timing.coefficient_range
+        lo, hi = timing._range
         if not (lo <= timing_coeff <= hi):
             raise ValueError(
                 f"timing_coeff {timing_coeff} 超出 {timing.value} 级允许范围 [{lo}, {hi}]"
             )
 
-    dna_cap = dna.max_position_pct
+    dna_cap = dna._cap
     target_pct = dna_cap * timing_coeff
     target_usd = total_capital * target_pct
 
@@ -79,10 +95,55 @@ def calculate_from_rating(
     return result
 
 
+# 单元格字段顺序 (与 _sensitivity_rows 返回的元组按位置对应)
+_CELL_FIELDS = (
+    "dna_label", "timing_label", "dna_cap_pct", "timing_coeff", "target_pct", "target_usd",
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _sensitivity_rows(total_capital: float) -> tuple:
+    """
+    灵敏度表的不可变核心，按 total_capital 缓存
+
+    一个会话里只有少数几个总资产取值，UI 轮询 / 重复打印直接命中缓存。
+    不对 total_capital 做取整: target_usd 精确到分，取整会改变结果。
+
+    Returns:
+        ((dna_value, ((timing_value, cell_tuple), ...)), ...)
+        cell_tuple 字段见 _CELL_FIELDS
+    """
+    # 一次外积得到全部 pct；取整仍用 Python round —— np.round 先乘 10^n 再取整，
+    # 与 round() 的正确舍入在约 3% 的单元格上结果不同
+    pct_mat = np.outer(_DNA_CAPS, _COEFFS)
+    pct_rows = pct_mat.tolist()
+    usd_rows = (total_capital * pct_mat).tolist()
+
+    rows = []
+    for dna, cap_pct, pct_row, usd_row in zip(
+        _DNA_AXIS, _DNA_CAP_PCT_ROUNDED, pct_rows, usd_rows
+    ):
+        dna_label = dna.label
+        rows.append((dna.value, tuple(
+            (timing.value, (
+                dna_label,
+                timing.label,
+                cap_pct,
+                coeff,
+                round(pct * 100, 2),
+                round(usd, 2),
+            ))
+            for timing, coeff, pct, usd in zip(_TIMING_AXIS, _COEFF_LIST, pct_row, usd_row)
+        )))
+    return tuple(rows)
+
+
 def generate_sensitivity_table(total_capital: float) -> Dict[str, Dict[str, dict]]:
     """
     生成 DNA x Timing 全组合灵敏度表
 
+    每次调用返回新的 dict (调用方可自由修改)，底层数值来自 _sensitivity_rows 缓存。
+
     Returns:
         {
             "S": {
@@ -93,73 +154,121 @@ def generate_sensitivity_table(total_capital: float) -> Dict[str, Dict[str, dict
             ...
         }
     """
-    table = {}
-    for dna in DNARating:
-        table[dna.value] = {}
-        for timing in TimingRating:
-            coeff = timing.midpoint
-            pct = dna.max_position_pct * coeff
-            table[dna.value][timing.value] = {
-                "dna_label": dna.label,
-                "timing_label": timing.label,
-                "dna_cap_pct": round(dna.max_position_pct * 100, 1),
-                "timing_coeff": coeff,
-                "target_pct": round(pct * 100, 2),
-                "target_usd": round(total_capital * pct, 2),
-            }
-    return table
+    return {
+        dna_value: {
+            timing_value: dict(zip(_CELL_FIELDS, cell))
+            for timing_value, cell in cells
+        }
+        for dna_value, cells in _sensitivity_rows(total_capital)
+    }
 
 
 def print_sensitivity_table(total_capital: float) -> None:
-    """打印灵敏度表"""
-    table = generate_sensitivity_table(total_capital)
+    """打印灵敏度表 (整表拼成一个字符串，一次 print 输出)"""
     cap_str = f"${total_capital:,.0f}"
-
-    print(f"\nOPRMS 灵敏度表 (总资产: {cap_str})")
-    print("=" * 75)
     header_dna = "DNA \\ Timing"
-    print(f"{header_dna:<15} {'S (千载难逢)':<16} {'A (趋势确立)':<16} {'B (正常波动)':<16} {'C (垃圾时间)':<16}")
-    print("-" * 75)
+    lines = [
+        f"\nOPRMS 灵敏度表 (总资产: {cap_str})",
+        "=" * 75,
+        f"{header_dna:<15} {'S (千载难逢)':<16} {'A (趋势确立)':<16} {'B (正常波动)':<16} {'C (垃圾时间)':<16}",
+        "-" * 75,
+    ]
+
+    # 直接遍历缓存的元组，不经过 dict 转换
+    for dna, (_, cells) in zip(_DNA_AXIS, _sensitivity_rows(total_capital)):
+        lines.append(f"{dna.value} {dna.label:<10}" + "".join(
+            f" {pct:>5.1f}% ${usd:>10,.0f}" for _, (_, _, _, _, pct, usd) in cells
+        ))
+
+    lines.append("=" * 75)
+    print("\n".join(lines))
+
+
+# load_ratings 解析结果缓存: {str(path): (st_mtime_ns, st_size, {symbol: OPRMSRating})}
+# 每个路径只保留最新一份；文件 mtime / 大小变化即重新解析
+_RATINGS_CACHE: Dict[str, Tuple[int, int, Dict[str, OPRMSRating]]] = {}
+
+
+# OPRMSRating.from_dict 的必填字段 (按其读取顺序，报错时报告第一个缺失字段)
+_REQUIRED_RATING_KEYS_ORDERED = ("symbol", "dna", "timing", "timing_coeff")
+_REQUIRED_RATING_KEYS = frozenset(_REQUIRED_RATING_KEYS_ORDERED)
 
-    for dna in DNARating:
-        row = f"{dna.value} {dna.label:<10}"
-        for timing in TimingRating:
-            cell = table[dna.value][timing.value]
-            pct = cell["target_pct"]
-            usd = cell["target_usd"]
-            row += f" {pct:>5.1f}% ${usd:>10,.0f}"
-        print(row)
 
-    print("=" * 75)
+def _copy_rating(rating: OPRMSRating) -> OPRMSRating:
+    """缓存中的评级不直接交给调用方 (OPRMSRating 可变)，返回独立副本"""
+    return dataclasses.replace(rating, evidence=list(rating.evidence))
+
+
+def _read_if_stale(path: Path) -> Tuple[Optional[os.stat_result], Optional[bytes]]:
+    """
+    I/O 阶段: stat 文件，缓存未命中时读出原始字节 (可在线程中并发执行)
+
+    Returns:
+        (stat 结果, 原始字节)；文件不存在为 (None, None)，缓存命中时字节为 None
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None, None
+    cached = _RATINGS_CACHE.get(str(path))
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return st, None
+    return st, path.read_bytes()
+
+
+def _ratings_from(
+    path: Path, st: Optional[os.stat_result], raw: Optional[bytes]
+) -> Dict[str, OPRMSRating]:
+    """解析阶段: 解析 _read_if_stale 读出的字节并写入缓存，返回评级副本"""
+    if st is None:
+        logger.warning(f"评级文件不存在: {path}")
+        return {}
+
+    key = str(path)
+    if raw is None:
+        ratings = _RATINGS_CACHE[key][2]
+    else:
+        data = json_loads(raw)
+
+        ratings = {}
+        for item in data.get("ratings", []):
+            # 缺必填字段的记录先用集合判断挑出，不走 from_dict 的 KeyError 异常路径
+            if not item.keys() >= _REQUIRED_RATING_KEYS:
+                missing = next(k for k in _REQUIRED_RATING_KEYS_ORDERED if k not in item)
+                logger.error(f"解析评级失败 {item.get('symbol', '?')}: {KeyError(missing)}")
+                continue
+            try:
+                rating = OPRMSRating.from_dict(item)
+                ratings[rating.symbol] = rating
+            except ValueError as e:
+                logger.error(f"解析评级失败 {item.get('symbol', '?')}: {e}")
+
+        _RATINGS_CACHE[key] = (st.st_mtime_ns, st.st_size, ratings)
+        logger.info(f"加载 {len(ratings)} 个评级 from {path}")
+
+    return {symbol: _copy_rating(rating) for symbol, rating in ratings.items()}
 
 
 def load_ratings(path: Path) -> Dict[str, OPRMSRating]:
     """
     从 JSON 文件加载评级数据
 
+    同一进程内文件未变 (mtime_ns + size 相同) 时不再重新解析，直接复制缓存结果。
+
     Args:
         path: JSON 文件路径
 
     Returns:
         {symbol: OPRMSRating}
     """
-    if not path.exists():
-        logger.warning(f"评级文件不存在: {path}")
-        return {}
+    return _ratings_from(path, *_read_if_stale(path))
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    ratings = {}
-    for item in data.get("ratings", []):
-        try:
-            rating = OPRMSRating.from_dict(item)
-            ratings[rating.symbol] = rating
-        except (KeyError, ValueError) as e:
-            logger.error(f"解析评级失败 {item.get('symbol', '?')}: {e}")
-
-    logger.info(f"加载 {len(ratings)} 个评级 from {path}")
-    return ratings
+def _dump_ratings_file(data: dict) -> bytes:
+    """评级文件 → 2 空格缩进的 UTF-8 JSON；orjson 可用时用它序列化"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 def save_ratings(ratings: Dict[str, OPRMSRating], path: Path) -> None:
@@ -178,7 +287,47 @@ def save_ratings(ratings: Dict[str, OPRMSRating], path: Path) -> None:
         "ratings": [r.to_dict() for r in ratings.values()],
     }
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(path, "wb") as f:
+        f.write(_dump_ratings_file(data))
+    # 同一 mtime 刻度内重写且大小不变时 stat 无法区分，显式失效
+    _RATINGS_CACHE.pop(str(path), None)
 
     logger.info(f"保存 {len(ratings)} 个评级 to {path}")
+
+
+# 批量读写的线程数上限
+_BATCH_MAX_WORKERS = 8
+
+
+def load_ratings_many(paths: Sequence[Path]) -> Dict[Path, Dict[str, OPRMSRating]]:
+    """
+    批量加载多个评级文件
+
+    stat + 读文件在线程池中重叠进行 (I/O 释放 GIL)；解析与建对象受 GIL 约束，
+    放在调用线程串行完成，避免线程间争抢 GIL。缓存语义与 load_ratings 相同。
+
+    Args:
+        paths: JSON 文件路径列表
+
+    Returns:
+        {path: {symbol: OPRMSRating}}，顺序与 paths 一致；缺失文件为空 dict
+    """
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(paths))) as executor:
+        reads = list(executor.map(_read_if_stale, paths))
+    return {path: _ratings_from(path, st, raw) for path, (st, raw) in zip(paths, reads)}
+
+
+def save_ratings_many(ratings_by_path: Mapping[Path, Dict[str, OPRMSRating]]) -> None:
+    """
+    批量保存评级文件，文件写入在线程池中重叠进行
+
+    Args:
+        ratings_by_path: {输出路径: {symbol: OPRMSRating}}
+    """
+    if not ratings_by_path:
+        return
+    with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(ratings_by_path))) as executor:
+        # list() 消费迭代器，使任一文件写入失败的异常在这里抛出
+        list(executor.map(save_ratings, ratings_by_path.values(), ratings_by_path.keys()))
@@ -3,4 +3,33 @@
 
 基于 BidClub Ticker-to-Thesis 框架，6 位 AI 分析师各持一种投资哲学。
 """
-from knowledge.philosophies.base import InvestmentLens, format_prompt, get_all_lenses
+import importlib
+
+__all__ = ["InvestmentLens", "format_prompt", "get_all_lenses"]
+
+# 透镜子模块 (各自提供 get_lens)
+_LENS_MODULES = frozenset({
+    "quality_compounder",
+    "imaginative_growth",
+    "fundamental_ls",
+    "deep_value",
+    "event_driven",
+    "macro_tactical",
+})
+
+
+# ============ 延迟加载 (PEP 562) ============
+
+def __getattr__(name):
+    # base (dataclasses 等) 在首次访问导出名时才 import
+    if name in __all__:
+        from knowledge.philosophies import base
+        return getattr(base, name)
+    # 单个透镜按需加载，不连带其余模块
+    if name in _LENS_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _LENS_MODULES)
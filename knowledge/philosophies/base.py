@@ -1,22 +1,74 @@
 """
 投资哲学透镜 — 基础模型和工具函数
 """
+import functools
+import string
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InvestmentLens:
-    """单个投资哲学透镜"""
+    """单个投资哲学透镜 (frozen: get_lens 缓存后各调用方共享同一实例)"""
     name: str                    # 英文名称
     philosophy: str              # 哲学描述
     core_metric: str             # 核心指标
     horizon: str                 # 投资期限
     persona: str                 # AI 角色描述
-    key_questions: List[str]     # 必须回答的核心问题
+    key_questions: Tuple[str, ...]  # 必须回答的核心问题
     analysis_framework: str      # 分析框架描述
     prompt_template: str         # AI 分析的 prompt 模板
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = field(default_factory=tuple)
+    # 构造时预渲染: 常量字段已代入模板，切分为字面片段 + 运行时占位符
+    _prompt_segments: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _prompt_slots: Tuple[Tuple[str, str, str], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        segments, slots = _specialize_template(self)
+        object.__setattr__(self, "_prompt_segments", segments)
+        object.__setattr__(self, "_prompt_slots", slots)
+
+
+# 每次调用才确定的占位符；其余字段在透镜构造时即代入
+_RUNTIME_FIELDS = frozenset({"ticker", "context"})
+_FORMATTER = string.Formatter()
+
+
+def _specialize_template(lens: InvestmentLens):
+    """
+    将透镜常量代入 prompt_template
+
+    Returns:
+        (segments, slots): len(segments) == len(slots) + 1，
+        slots 为 (字段名, conversion, format_spec)，渲染时与 segments 交替拼接
+    """
+    constants = {
+        "lens_name": lens.name,
+        "philosophy": lens.philosophy,
+        "core_metric": lens.core_metric,
+        "horizon": lens.horizon,
+        "persona": lens.persona,
+        "key_questions": "\n".join(
+            f"  {i+1}. {q}" for i, q in enumerate(lens.key_questions)
+        ),
+        "analysis_framework": lens.analysis_framework,
+    }
+    segments = []
+    slots = []
+    current = []
+    for literal, name, spec, conversion in _FORMATTER.parse(lens.prompt_template):
+        current.append(literal)
+        if name is None:
+            continue
+        if name in _RUNTIME_FIELDS:
+            segments.append("".join(current))
+            current = []
+            slots.append((name, conversion or "", spec or ""))
+        else:
+            value = _FORMATTER.convert_field(constants[name], conversion)
+            current.append(_FORMATTER.format_field(value, spec))
+    segments.append("".join(current))
+    return tuple(segments), tuple(slots)
 
 
 def format_prompt(lens: InvestmentLens, ticker: str, context: Dict = None) -> str:
@@ -33,32 +85,32 @@ def format_prompt(lens: InvestmentLens, ticker: str, context: Dict = None) -> st
     """
     ctx_block = ""
     if context:
-        ctx_parts = []
-        for key, value in context.items():
-            ctx_parts.append(f"### {key}\n{value}")
-        ctx_block = "\n\n".join(ctx_parts)
-
-    questions_block = "\n".join(f"  {i+1}. {q}" for i, q in enumerate(lens.key_questions))
-
-    return lens.prompt_template.format(
-        ticker=ticker,
-        lens_name=lens.name,
-        philosophy=lens.philosophy,
-        core_metric=lens.core_metric,
-        horizon=lens.horizon,
-        persona=lens.persona,
-        key_questions=questions_block,
-        analysis_framework=lens.analysis_framework,
-        context=ctx_block,
-    )
-
-
-def get_all_lenses() -> List[InvestmentLens]:
-    """返回全部 5 个投资哲学透镜（宏观分析由 Stage 0 简报承担，不再作为透镜）"""
+        ctx_block = "\n\n".join(f"### {key}\n{value}" for key, value in context.items())
+
+    values = {"ticker": ticker, "context": ctx_block}
+    segments = lens._prompt_segments
+    parts = [segments[0]]
+    for (name, conversion, spec), segment in zip(lens._prompt_slots, segments[1:]):
+        value = values[name]
+        if conversion:
+            value = _FORMATTER.convert_field(value, conversion)
+        parts.append(format(value, spec))
+        parts.append(segment)
+    return "".join(parts)
+
+
+@functools.cache
+def get_all_lenses() -> Tuple[InvestmentLens, ...]:
+    """
+    返回全部 5 个投资哲学透镜（宏观分析由 Stage 0 简报承担，不再作为透镜）
+
+    结果缓存并共享，返回 tuple；需要增删透镜的调用方先 list() 复制。
+    """
+    # 透镜模块反向 import 本模块的 InvestmentLens，因此保持函数内延迟 import
     from knowledge.philosophies.quality_compounder import get_lens as qc
     from knowledge.philosophies.imaginative_growth import get_lens as ig
     from knowledge.philosophies.fundamental_ls import get_lens as fls
     from knowledge.philosophies.deep_value import get_lens as dv
     from knowledge.philosophies.event_driven import get_lens as ed
 
-    return [qc(), ig(), fls(), dv(), ed()]
+    return (qc(), ig(), fls(), dv(), ed())
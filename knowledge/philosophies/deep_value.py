@@ -4,9 +4,12 @@ Lens 4: Deep Value — 深度价值
 格雷厄姆/Klarman 风格。寻找市场严重低估、有安全边际的机会。
 关注重置成本、有形资产、管理层激励对齐。
 """
+import functools
+
 from knowledge.philosophies.base import InvestmentLens
 
 
+@functools.cache
 def get_lens() -> InvestmentLens:
     return InvestmentLens(
         name="Deep Value",
@@ -20,13 +23,13 @@ def get_lens() -> InvestmentLens:
             "being contrarian and patient. You focus on downside protection first — "
             "if you protect the downside, the upside takes care of itself."
         ),
-        key_questions=[
+        key_questions=(
             "What is the replacement cost of this business's assets, and how does it compare to the current market cap?",
             "Where is the margin of safety — what downside protection exists even if the thesis is wrong?",
             "Why is the market mispricing this? Is it a structural reason (index exclusion, complexity) or fundamental?",
             "What are management's incentives — are they aligned with minority shareholders? Any activist potential?",
             "What hidden assets or liabilities might the market be missing (real estate, IP, litigation, off-balance-sheet)?",
-        ],
+        ),
         analysis_framework=(
             "1. Asset Valuation: Net asset value, replacement cost, sum-of-parts, "
             "liquidation value. Compare to market cap.\n"
@@ -58,5 +61,5 @@ def get_lens() -> InvestmentLens:
             "- 列出 2-3 个可观测的触杀条件\n"
             "- 80%+ 主动语态，不用模棱两可的措辞\n"
         ),
-        tags=["value", "contrarian", "margin-of-safety", "asset-backed", "activist"],
+        tags=("value", "contrarian", "margin-of-safety", "asset-backed", "activist"),
     )
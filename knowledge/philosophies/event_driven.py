@@ -4,9 +4,12 @@ Lens 5: Event-Driven — 事件驱动
 围绕特定企业事件（并购、分拆、重组、监管变化）寻找定价偏差。
 强调催化剂时间线和概率评估。
 """
+import functools
+
 from knowledge.philosophies.base import InvestmentLens
 
 
+@functools.cache
 def get_lens() -> InvestmentLens:
     return InvestmentLens(
         name="Event-Driven",
@@ -20,13 +23,13 @@ def get_lens() -> InvestmentLens:
             "You think in probabilities and payoffs, not narratives. You demand a clear "
             "timeline and measurable milestones for every position."
         ),
-        key_questions=[
+        key_questions=(
             "What is the specific catalyst, and what is the probability-weighted timeline for it to play out?",
             "How is the market pricing this event — is there a spread or mispricing you can exploit?",
             "What are the alternative outcomes if the primary catalyst fails? What is the downside in each scenario?",
             "What are the observable milestones between now and the event that will confirm or deny the thesis?",
             "What is the optimal instrument — equity, options, or structured trade — to express this view?",
-        ],
+        ),
         analysis_framework=(
             "1. Catalyst Identification: Define the event precisely. "
             "What must happen, by when, and what is the probability?\n"
@@ -58,5 +61,5 @@ def get_lens() -> InvestmentLens:
             "- 列出 2-3 个带时间触发器的触杀条件\n"
             "- 80%+ 主动语态，不用模棱两可的措辞\n"
         ),
-        tags=["event-driven", "catalyst", "M&A", "spinoff", "restructuring"],
+        tags=("event-driven", "catalyst", "M&A", "spinoff", "restructuring"),
     )
@@ -4,9 +4,12 @@ Lens 3: Fundamental Long/Short — 基本面多空
 Tiger Cub 风格对冲基金方法。通过基本面研究寻找
 低估 long 和高估 short，强调相对价值和催化剂。
 """
+import functools
+
 from knowledge.philosophies.base import InvestmentLens
 
 
+@functools.cache
 def get_lens() -> InvestmentLens:
     return InvestmentLens(
         name="Fundamental Long/Short",
@@ -20,13 +23,13 @@ def get_lens() -> InvestmentLens:
             "sides — what is the long thesis AND what is the short thesis? You seek "
             "asymmetric risk/reward with identifiable catalysts."
         ),
-        key_questions=[
+        key_questions=(
             "How does the company's EV/EBITDA compare to sector peers, and is the spread justified by fundamentals?",
             "What specific catalyst will cause the market to re-rate this stock within 1-3 years?",
             "What is the short interest, and what are shorts seeing that the market might be missing?",
             "What are the key sector dynamics — is the industry consolidating, growing, or declining?",
             "What is the natural hedge pair if this is a long position? What would you short against it?",
-        ],
+        ),
         analysis_framework=(
             "1. Relative Valuation: EV/EBITDA, EV/Revenue, P/FCF vs sector peers. "
             "Identify where the company sits in the distribution.\n"
@@ -57,5 +60,5 @@ def get_lens() -> InvestmentLens:
             "- 列出 2-3 个可观测的触杀条件\n"
             "- 80%+ 主动语态，不用模棱两可的措辞\n"
         ),
-        tags=["long-short", "relative-value", "catalyst", "hedging", "EV/EBITDA"],
+        tags=("long-short", "relative-value", "catalyst", "hedging", "EV/EBITDA"),
     )
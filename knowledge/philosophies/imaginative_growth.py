@@ -4,9 +4,12 @@ Lens 2: Imaginative Growth — 想象力成长
 寻找 TAM 巨大、颠覆性潜力、处于 S-curve 早期的公司。
 愿意为远大愿景支付溢价，但要求清晰的 PMF 和执行路径。
 """
+import functools
+
 from knowledge.philosophies.base import InvestmentLens
 
 
+@functools.cache
 def get_lens() -> InvestmentLens:
     return InvestmentLens(
         name="Imaginative Growth",
@@ -20,13 +23,13 @@ def get_lens() -> InvestmentLens:
             "but demand evidence of product-market fit and a credible path to scale. "
             "You think in decades, not quarters."
         ),
-        key_questions=[
+        key_questions=(
             "How large is the TAM, and what is the current penetration rate? Is the TAM expanding or contracting?",
             "Is there clear product-market fit? What is the evidence (NPS, retention, organic growth, customer behavior)?",
             "What is the competitive landscape — is this winner-take-most or fragmented? What is the defensibility moat being built?",
             "What is the path to profitability and at what scale does unit economics become compelling?",
             "Is management visionary AND operationally capable? Can they scale from $1B to $10B+ revenue?",
-        ],
+        ),
         analysis_framework=(
             "1. TAM Sizing: Bottom-up TAM calculation, penetration rate, growth rate of addressable market.\n"
             "2. Product-Market Fit: Retention curves, NPS, revenue per customer trends, organic vs paid growth.\n"
@@ -52,5 +55,5 @@ def get_lens() -> InvestmentLens:
             "- 列出 2-3 个与增长指标挂钩的触杀条件\n"
             "- 80%+ 主动语态，不用模棱两可的措辞\n"
         ),
-        tags=["growth", "TAM", "disruption", "S-curve", "innovation"],
+        tags=("growth", "TAM", "disruption", "S-curve", "innovation"),
     )
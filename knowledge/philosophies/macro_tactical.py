@@ -4,9 +4,12 @@ Lens 6: Macro-Tactical — 宏观战术
 自上而下分析 Fed 政策、流动性周期、宏观 regime。
 评估个股如何 fit 进当前宏观环境。
 """
+import functools
+
 from knowledge.philosophies.base import InvestmentLens
 
 
+@functools.cache
 def get_lens() -> InvestmentLens:
     return InvestmentLens(
         name="Macro-Tactical",
@@ -21,13 +24,13 @@ def get_lens() -> InvestmentLens:
             "stories. You are the contrarian check against bottom-up analysts who ignore the "
             "macro backdrop."
         ),
-        key_questions=[
+        key_questions=(
             "How sensitive is this company to interest rate changes? What happens in a +200bp / -200bp scenario?",
             "Where are we in the economic cycle (early, mid, late, recession)? Does this sector/stock outperform in this phase?",
             "What is the current liquidity regime (Fed tightening/easing, QT/QE) and how does it affect this stock's multiple?",
             "What are the key geopolitical risks and how exposed is this company (revenue geography, supply chain, regulation)?",
             "What macro indicators should we monitor as leading signals for this position (yield curve, credit spreads, PMI)?",
-        ],
+        ),
         analysis_framework=(
             "1. Regime Identification: Classify current macro environment. "
             "Growth/inflation quadrant, Fed stance, credit conditions.\n"
@@ -58,5 +61,5 @@ def get_lens() -> InvestmentLens:
             "- Specify 2-3 observable kill conditions tied to macro triggers\n"
             "- Use 80%+ active voice, no hedge words on beliefs\n"
         ),
-        tags=["macro", "rates", "liquidity", "regime", "geopolitical"],
+        tags=("macro", "rates", "liquidity", "regime", "geopolitical"),
     )
@@ -4,9 +4,12 @@ Lens 1: Quality Compounder — 质量复利
 Buffett/Munger 风格。寻找拥有持久护城河、高 ROIC、
 可以持有 20+ 年的超级复利机器。
 """
+import functools
+
 from knowledge.philosophies.base import InvestmentLens
 
 
+@functools.cache
 def get_lens() -> InvestmentLens:
     return InvestmentLens(
         name="Quality Compounder",
@@ -19,13 +22,13 @@ def get_lens() -> InvestmentLens:
             "capital at high rates for decades. You are deeply skeptical of hype and "
             "focus on proven unit economics, management integrity, and reinvestment runway."
         ),
-        key_questions=[
+        key_questions=(
             "What is the company's moat, and how durable is it against technological disruption and competitive entry?",
             "What is the ROIC trend over 5-10 years, and is the reinvestment runway sufficient for continued compounding?",
             "How does management allocate capital — are they reinvesting at high incremental ROIC or destroying value?",
             "What is the normalized owner earnings power, stripping out one-time items and stock-based compensation?",
             "At what price does this become a 15%+ IRR opportunity even with conservative growth assumptions?",
-        ],
+        ),
         analysis_framework=(
             "1. Moat Analysis: Identify the competitive advantage (network effects, switching costs, "
             "intangible assets, cost advantages, scale). Rate durability 1-10.\n"
@@ -52,5 +55,5 @@ def get_lens() -> InvestmentLens:
             "- 列出 2-3 个可观测的触杀条件\n"
             "- 80%+ 主动语态，不用模棱两可的措辞\n"
         ),
-        tags=["long-term", "quality", "moat", "ROIC", "compounder"],
+        tags=("long-term", "quality", "moat", "ROIC", "compounder"),
     )
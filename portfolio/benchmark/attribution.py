@@ -6,8 +6,9 @@ Decomposes active return into:
 - Timing effect: value from entry/exit timing decisions
 - Sizing effect: value from over/under-weighting positions vs OPRMS targets
 """
+import heapq
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 import numpy as np
@@ -18,6 +19,73 @@ from portfolio.holdings.history import get_position_history
 logger = logging.getLogger(__name__)
 
 
+def _window_mean_close(df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp):
+    """
+    Mean close over [start, end] (NaN-skipping, same as Series.mean), or None if no rows.
+
+    Price caches are date-sorted (descending from load_price_cache), so the window
+    bounds come from searchsorted on the raw arrays instead of two boolean masks and
+    a filtered DataFrame copy per position. Unsorted dates, NaT or non-numeric closes
+    fall back to mask filtering.
+    """
+    dates = df["date"].values
+    closes = df["close"].values
+    n = len(dates)
+
+    if dates.dtype.kind == "M" and closes.dtype.kind in "fiu":
+        lo_key = start.to_datetime64()
+        hi_key = end.to_datetime64()
+        if (dates[:-1] <= dates[1:]).all():
+            lo = np.searchsorted(dates, lo_key, "left")
+            hi = np.searchsorted(dates, hi_key, "right")
+        elif (dates[:-1] >= dates[1:]).all():
+            ascending = dates[::-1]
+            lo = n - np.searchsorted(ascending, hi_key, "right")
+            hi = n - np.searchsorted(ascending, lo_key, "left")
+        else:
+            lo = hi = None
+
+        if lo is not None:
+            if hi <= lo:
+                return None
+            window = closes[lo:hi]
+            if closes.dtype.kind == "f":
+                missing = np.isnan(window)
+                if missing.any():
+                    # Same as pandas nanmean: zero-fill NaNs, sum, divide by valid count
+                    count = len(window) - missing.sum()
+                    return np.where(missing, 0.0, window).sum() / count if count else np.nan
+            return window.mean()
+
+    df = df[(df["date"] >= start) & (df["date"] <= end)]
+    if df.empty:
+        return None
+    return df["close"].mean()
+
+
+def _rank_by_effect(
+    by_position: dict,
+    effect_of: Callable = lambda v: v,
+    top_k: Optional[int] = None,
+) -> dict:
+    """
+    Order by_position by descending |effect|; keep only the top_k largest if given.
+
+    heapq.nsmallest is equivalent to sorted(...)[:top_k] (ties keep insertion
+    order) but only partially orders the positions.
+    """
+    def key(item):
+        return -abs(effect_of(item[1]))
+
+    if top_k is None:
+        return dict(sorted(by_position.items(), key=key))
+    return dict(heapq.nsmallest(top_k, by_position.items(), key=key))
+
+
+def _effect_field(entry: dict) -> float:
+    return entry["effect"]
+
+
 class AttributionEngine:
     """Brinson-style alpha attribution analysis."""
 
@@ -28,6 +96,7 @@ class AttributionEngine:
         self,
         position_returns: Dict[str, float],
         benchmark_return: float,
+        top_k: Optional[int] = None,
     ) -> Dict[str, float]:
         """
         Measure value added from stock selection.
@@ -38,6 +107,7 @@ class AttributionEngine:
         Args:
             position_returns: {symbol: period_return} for each position
             benchmark_return: benchmark period return
+            top_k: only report the top_k largest |contributions| (total still covers all)
 
         Returns:
             {"total": float, "by_position": {symbol: contribution}}
@@ -55,13 +125,14 @@ class AttributionEngine:
 
         return {
             "total": round(total, 6),
-            "by_position": dict(sorted(by_position.items(), key=lambda x: -abs(x[1]))),
+            "by_position": _rank_by_effect(by_position, top_k=top_k),
         }
 
     def sizing_effect(
         self,
         position_returns: Dict[str, float],
         benchmark_return: float,
+        top_k: Optional[int] = None,
     ) -> Dict[str, float]:
         """
         Measure value added/lost from over/under-weighting vs OPRMS targets.
@@ -71,6 +142,7 @@ class AttributionEngine:
         Args:
             position_returns: {symbol: period_return}
             benchmark_return: benchmark period return
+            top_k: only report the top_k largest |effects| (total still covers all)
 
         Returns:
             {"total": float, "by_position": {symbol: {"effect": ..., "drift": ...}}}
@@ -94,9 +166,7 @@ class AttributionEngine:
 
         return {
             "total": round(total, 6),
-            "by_position": dict(sorted(
-                by_position.items(), key=lambda x: -abs(x[1]["effect"])
-            )),
+            "by_position": _rank_by_effect(by_position, _effect_field, top_k),
         }
 
     def timing_effect_from_history(
@@ -104,6 +174,7 @@ class AttributionEngine:
         price_data: Dict[str, pd.DataFrame],
         start_date: str,
         end_date: str,
+        top_k: Optional[int] = None,
     ) -> Dict[str, float]:
         """
         Estimate timing effect from position history.
@@ -115,6 +186,7 @@ class AttributionEngine:
             price_data: {symbol: DataFrame with date/close columns}
             start_date: period start (YYYY-MM-DD)
             end_date: period end (YYYY-MM-DD)
+            top_k: only report the top_k largest |effects| (total still covers all)
 
         Returns:
             {"total": float, "by_position": {symbol: {"effect": ..., "avg_price": ..., "entry_price": ...}}}
@@ -129,13 +201,10 @@ class AttributionEngine:
             if p.symbol not in price_data or p.cost_basis <= 0:
                 continue
 
-            df = price_data[p.symbol]
-            df = df[(df["date"] >= start) & (df["date"] <= end)]
-
-            if df.empty:
+            avg_price = _window_mean_close(price_data[p.symbol], start, end)
+            if avg_price is None:
                 continue
 
-            avg_price = df["close"].mean()
             if avg_price <= 0:
                 continue
 
@@ -150,9 +219,7 @@ class AttributionEngine:
 
         return {
             "total": round(total, 6),
-            "by_position": dict(sorted(
-                by_position.items(), key=lambda x: -abs(x[1]["effect"])
-            )),
+            "by_position": _rank_by_effect(by_position, _effect_field, top_k),
         }
 
     def decompose_alpha(
@@ -162,10 +229,13 @@ class AttributionEngine:
         price_data: Optional[Dict[str, pd.DataFrame]] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        top_k: Optional[int] = None,
     ) -> dict:
         """
         Full alpha attribution breakdown.
 
+        top_k limits each component's by_position to its top_k largest |effects|.
+
         Returns:
             {
                 "total_active_return": float,
@@ -183,10 +253,10 @@ class AttributionEngine:
         active_return = portfolio_return - benchmark_return
 
         # Stock selection
-        selection = self.stock_selection_effect(position_returns, benchmark_return)
+        selection = self.stock_selection_effect(position_returns, benchmark_return, top_k)
 
         # Sizing
-        sizing = self.sizing_effect(position_returns, benchmark_return)
+        sizing = self.sizing_effect(position_returns, benchmark_return, top_k)
 
         result = {
             "total_active_return": round(active_return, 6),
@@ -198,7 +268,7 @@ class AttributionEngine:
 
         # Timing (optional, needs price data)
         if price_data and start_date and end_date:
-            timing = self.timing_effect_from_history(price_data, start_date, end_date)
+            timing = self.timing_effect_from_history(price_data, start_date, end_date, top_k)
             result["timing"] = timing
             # Residual = active - selection - sizing - timing
             result["residual"] = round(
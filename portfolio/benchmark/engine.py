@@ -20,6 +20,10 @@ logger = logging.getLogger(__name__)
 _PROJECT_ROOT = Path(__file__).parent.parent.parent
 _PRICE_DIR = _PROJECT_ROOT / "data" / "price"
 
+# Parsed price CSVs shared by every BenchmarkEngine in the process:
+# {str(csv_path): (st_mtime_ns, st_size, DataFrame)}. A changed file is re-parsed.
+_PRICE_FRAMES: Dict[str, Tuple[int, int, pd.DataFrame]] = {}
+
 # Supported benchmarks
 BENCHMARKS = {
     "SPY": "S&P 500 ETF",
@@ -34,6 +38,7 @@ class BenchmarkEngine:
     def __init__(self, positions: List[Position]):
         self.positions = positions
         self._price_cache: Dict[str, pd.DataFrame] = {}
+        self._returns_cache: Dict[tuple, Optional[pd.DataFrame]] = {}
 
     def calculate_portfolio_returns(
         self, start_date: str, end_date: Optional[str] = None
@@ -47,30 +52,11 @@ class BenchmarkEngine:
         if not self.positions:
             return None
 
-        # Collect price data for all positions
-        returns_data = {}
-        for p in self.positions:
-            prices = self._load_prices(p.symbol)
-            if prices is not None and not prices.empty:
-                prices = prices.set_index("date")["close"].sort_index()
-                daily_ret = prices.pct_change().dropna()
-                returns_data[p.symbol] = daily_ret
-
-        if not returns_data:
+        returns_df = self._returns_matrix(start_date, end_date)
+        if returns_df is None:
             logger.warning("No price data available for any position")
             return None
 
-        # Build returns DataFrame
-        returns_df = pd.DataFrame(returns_data)
-
-        # Filter date range
-        start = pd.to_datetime(start_date)
-        if end_date:
-            end = pd.to_datetime(end_date)
-            returns_df = returns_df.loc[start:end]
-        else:
-            returns_df = returns_df.loc[start:]
-
         if returns_df.empty:
             return None
 
@@ -81,12 +67,12 @@ class BenchmarkEngine:
             if p.symbol in returns_df.columns and total_weight > 0:
                 weights[p.symbol] = p.current_weight / total_weight
 
-        # Weighted portfolio return
-        portfolio_returns = pd.Series(0.0, index=returns_df.index)
-        for symbol, weight in weights.items():
-            if symbol in returns_df.columns:
-                col = returns_df[symbol].fillna(0)
-                portfolio_returns += col * weight
+        # Weighted portfolio return: one matrix-vector product over the held columns
+        if not weights:
+            return pd.Series(0.0, index=returns_df.index)
+        values = returns_df[list(weights)].fillna(0.0).to_numpy(dtype=np.float64)
+        w = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        portfolio_returns = pd.Series(values @ w, index=returns_df.index)
 
         return portfolio_returns
 
@@ -111,7 +97,7 @@ class BenchmarkEngine:
             return None
 
         prices = prices.set_index("date")["close"].sort_index()
-        daily_ret = prices.pct_change().dropna()
+        daily_ret = _daily_returns(prices)
 
         start = pd.to_datetime(start_date)
         if end_date:
@@ -152,16 +138,23 @@ class BenchmarkEngine:
         if aligned.empty:
             return {"error": "No overlapping dates between portfolio and benchmark"}
 
-        port = aligned["portfolio"]
-        bench = aligned["benchmark"]
-        active = port - bench
+        return self._relative_metrics(
+            aligned["portfolio"].to_numpy(), aligned["benchmark"].to_numpy()
+        )
+
+    def _relative_metrics(self, p: np.ndarray, b: np.ndarray) -> dict:
+        """
+        relative_performance statistics from two date-aligned, NaN-free,
+        non-empty return arrays.
+        """
+        active = p - b
 
         # Cumulative returns
-        cum_port = (1 + port).cumprod().iloc[-1] - 1
-        cum_bench = (1 + bench).cumprod().iloc[-1] - 1
+        cum_port = np.cumprod(1 + p)[-1] - 1
+        cum_bench = np.cumprod(1 + b)[-1] - 1
 
-        # Tracking error (annualized std of active returns)
-        te = active.std() * np.sqrt(252)
+        # Tracking error (annualized std of active returns; NaN for a single day, as pandas)
+        te = active.std(ddof=1) * np.sqrt(252) if len(active) > 1 else np.nan
 
         # Information ratio
         ir = (active.mean() * 252) / te if te > 0 else 0.0
@@ -172,10 +165,10 @@ class BenchmarkEngine:
             "active_return": round(float(cum_port - cum_bench), 6),
             "tracking_error": round(float(te), 6),
             "information_ratio": round(float(ir), 4),
-            "max_drawdown_portfolio": round(float(self._max_drawdown(port)), 6),
-            "max_drawdown_benchmark": round(float(self._max_drawdown(bench)), 6),
+            "max_drawdown_portfolio": round(self._max_drawdown(p), 6),
+            "max_drawdown_benchmark": round(self._max_drawdown(b), 6),
             "win_rate": round(float((active > 0).mean()), 4),
-            "trading_days": len(aligned),
+            "trading_days": len(p),
         }
 
     def compare_all_benchmarks(
@@ -185,24 +178,43 @@ class BenchmarkEngine:
         Compare portfolio against all available benchmarks.
 
         Returns dict keyed by benchmark name.
+
+        The portfolio and every available benchmark are aligned on one date
+        index in a single concat; each benchmark then keeps the dates where both
+        it and the portfolio have a return, the same rows relative_performance
+        would keep for the pair.
         """
         port_returns = self.calculate_portfolio_returns(start_date, end_date)
         if port_returns is None:
             return {"error": "No portfolio return data available"}
 
-        results = {}
-        for bm_symbol, bm_name in BENCHMARKS.items():
+        bm_series = {}
+        for bm_symbol in BENCHMARKS:
             bm_returns = self.calculate_benchmark_returns(bm_symbol, start_date, end_date)
             if bm_returns is not None:
-                results[bm_symbol] = {
-                    "name": bm_name,
-                    **self.relative_performance(port_returns, bm_returns),
-                }
-            else:
+                bm_series[bm_symbol] = bm_returns
+
+        if bm_series:
+            joint = pd.concat({"portfolio": port_returns, **bm_series}, axis=1, sort=True)
+            p_all = joint["portfolio"].to_numpy()
+            p_valid = ~np.isnan(p_all)
+
+        results = {}
+        for bm_symbol, bm_name in BENCHMARKS.items():
+            if bm_symbol not in bm_series:
                 results[bm_symbol] = {
                     "name": bm_name,
                     "error": f"Benchmark data not available for {bm_symbol}",
                 }
+                continue
+
+            b_all = joint[bm_symbol].to_numpy()
+            both = p_valid & ~np.isnan(b_all)
+            if both.any():
+                metrics = self._relative_metrics(p_all[both], b_all[both])
+            else:
+                metrics = {"error": "No overlapping dates between portfolio and benchmark"}
+            results[bm_symbol] = {"name": bm_name, **metrics}
 
         return results
 
@@ -211,53 +223,130 @@ class BenchmarkEngine:
     # -----------------------------------------------------------------------
 
     def _load_prices(self, symbol: str) -> Optional[pd.DataFrame]:
-        """Load price CSV from Data Desk cache."""
+        """
+        Load price CSV from Data Desk cache.
+
+        Parsed frames are shared across engines via _PRICE_FRAMES, keyed on the
+        file's mtime/size, so repeated reports in one process parse each CSV once.
+        """
         if symbol in self._price_cache:
             return self._price_cache[symbol]
 
         csv_path = _PRICE_DIR / f"{symbol}.csv"
-        if not csv_path.exists():
+        try:
+            st = csv_path.stat()
+        except FileNotFoundError:
             return None
 
-        try:
-            df = pd.read_csv(csv_path, parse_dates=["date"])
-            df = df.sort_values("date", ascending=True).reset_index(drop=True)
+        key = str(csv_path)
+        cached = _PRICE_FRAMES.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self._price_cache[symbol] = cached[2]
+            return cached[2]
+
+        df = _read_price_csv(symbol, csv_path)
+        if df is not None:
+            _PRICE_FRAMES[key] = (st.st_mtime_ns, st.st_size, df)
             self._price_cache[symbol] = df
-            return df
-        except Exception as e:
-            logger.warning(f"Failed to load prices for {symbol}: {e}")
-            return None
+        return df
 
     def _equal_weight_returns(
         self, start_date: str, end_date: Optional[str] = None
     ) -> Optional[pd.Series]:
         """Calculate equal-weighted return of all positions."""
+        returns_df = self._returns_matrix(start_date, end_date)
+        if returns_df is None:
+            return None
+
+        # Equal weight = simple mean across columns
+        return returns_df.mean(axis=1)
+
+    def _returns_matrix(
+        self, start_date: str, end_date: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Daily returns of every position with price data, one column per symbol,
+        filtered to [start_date, end_date]. None if no position has prices.
+
+        Shared by calculate_portfolio_returns and _equal_weight_returns, and cached
+        per (date range, position symbols) so compare_all_benchmarks builds it once.
+        """
+        key = (start_date, end_date, tuple(p.symbol for p in self.positions))
+        if key in self._returns_cache:
+            return self._returns_cache[key]
+
         returns_data = {}
         for p in self.positions:
             prices = self._load_prices(p.symbol)
             if prices is not None and not prices.empty:
                 prices = prices.set_index("date")["close"].sort_index()
-                returns_data[p.symbol] = prices.pct_change().dropna()
-
-        if not returns_data:
-            return None
+                returns_data[p.symbol] = _daily_returns(prices)
 
-        returns_df = pd.DataFrame(returns_data)
+        returns_df = None
+        if returns_data:
+            returns_df = pd.DataFrame(returns_data)
 
-        start = pd.to_datetime(start_date)
-        if end_date:
-            end = pd.to_datetime(end_date)
-            returns_df = returns_df.loc[start:end]
-        else:
-            returns_df = returns_df.loc[start:]
+            start = pd.to_datetime(start_date)
+            if end_date:
+                end = pd.to_datetime(end_date)
+                returns_df = returns_df.loc[start:end]
+            else:
+                returns_df = returns_df.loc[start:]
 
-        # Equal weight = simple mean across columns
-        return returns_df.mean(axis=1)
+        self._returns_cache[key] = returns_df
+        return returns_df
 
     @staticmethod
-    def _max_drawdown(returns: pd.Series) -> float:
-        """Calculate maximum drawdown from a return series."""
-        cumulative = (1 + returns).cumprod()
+    def _max_drawdown(returns) -> float:
+        """
+        Calculate maximum drawdown from a return series (pd.Series or ndarray).
+        """
+        r = returns.to_numpy() if isinstance(returns, pd.Series) else np.asarray(returns)
+        # Fast path on the raw float buffer; pandas handles the NaN-skipping cases
+        # (NaN returns, or 0/0 drawdowns after a -100% day) and non-float input
+        if r.dtype.kind == "f" and len(r) and not np.isnan(r).any():
+            cumulative = np.cumprod(1 + r)
+            running_max = np.maximum.accumulate(cumulative)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drawdown = (cumulative - running_max) / running_max
+            if not np.isnan(drawdown).any():
+                return float(drawdown.min())
+
+        cumulative = (1 + pd.Series(r)).cumprod()
         running_max = cumulative.cummax()
         drawdown = (cumulative - running_max) / running_max
         return float(drawdown.min())
+
+
+def _read_price_csv(symbol: str, csv_path: Path) -> Optional[pd.DataFrame]:
+    """Parse one price CSV sorted by date; None (logged) if it cannot be read."""
+    try:
+        df = pd.read_csv(csv_path, parse_dates=["date"])
+        return df.sort_values("date", ascending=True).reset_index(drop=True)
+    except Exception as e:
+        logger.warning(f"Failed to load prices for {symbol}: {e}")
+        return None
+
+
+def _daily_returns(prices: pd.Series) -> pd.Series:
+    """
+    prices.pct_change().dropna(), computed on the raw buffer.
+
+    pct_change is prices / prices.shift(1) - 1, so the same division on
+    adjacent slices gives identical values without the shifted copy and the
+    leading NaN. NaN results (gaps in closes) are dropped as dropna would.
+    Non-numeric closes go through pandas.
+    """
+    vals = prices.to_numpy()
+    if vals.dtype.kind not in "fiu":
+        return prices.pct_change().dropna()
+
+    vals = vals.astype(np.float64, copy=False)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ret = vals[1:] / vals[:-1] - 1.0
+    index = prices.index[1:]
+    valid = ~np.isnan(ret)
+    if not valid.all():
+        ret = ret[valid]
+        index = index[valid]
+    return pd.Series(ret, index=index, name=prices.name)
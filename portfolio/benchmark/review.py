@@ -105,8 +105,7 @@ def generate_weekly_snapshot(positions: Optional[List[Position]] = None) -> str:
         return "# Weekly Snapshot\n\nNo positions in portfolio."
 
     today = datetime.now().strftime("%Y-%m-%d")
-    total_value = sum(p.market_value for p in positions)
-    total_cost = sum(p.shares * p.cost_basis for p in positions)
+    total_value, total_cost = _value_and_cost(positions)
     total_pnl = total_value - total_cost
     total_pnl_pct = total_pnl / total_cost if total_cost > 0 else 0
 
@@ -254,8 +253,7 @@ def generate_quarterly_review(
         return "# Quarterly Review\n\nNo positions in portfolio."
 
     today = datetime.now().strftime("%Y-%m-%d")
-    total_value = sum(p.market_value for p in positions)
-    total_cost = sum(p.shares * p.cost_basis for p in positions)
+    total_value, total_cost = _value_and_cost(positions)
 
     lines = []
     lines.append(f"# Quarterly Review ({today})")
@@ -349,6 +347,16 @@ def generate_quarterly_review(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _value_and_cost(positions: List[Position]):
+    """Total market value and total cost basis in one pass over the positions."""
+    total_value = 0
+    total_cost = 0
+    for p in positions:
+        total_value += p.market_value
+        total_cost += p.shares * p.cost_basis
+    return total_value, total_cost
+
+
 def _estimate_shares_adjustment(position: Position, weight_drift: float) -> str:
     """Estimate shares to buy/sell to correct drift."""
     if position.current_price <= 0:
@@ -8,7 +8,7 @@ Each rule returns Alert objects with severity levels:
 """
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from typing import List, Optional
 
@@ -24,6 +24,10 @@ class AlertLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# Severity order for run_all_checks output
+_LEVEL_ORDER = (AlertLevel.CRITICAL, AlertLevel.WARNING, AlertLevel.INFO)
+
+
 @dataclass
 class Alert:
     """A single exposure alert."""
@@ -81,11 +85,16 @@ def run_all_checks(positions: List[Position]) -> List[Alert]:
     # Rule 7: Stale reviews
     alerts.extend(_check_review_dates(positions))
 
-    # Sort: CRITICAL > WARNING > INFO
-    priority = {AlertLevel.CRITICAL: 0, AlertLevel.WARNING: 1, AlertLevel.INFO: 2}
-    alerts.sort(key=lambda a: priority.get(a.level, 99))
+    # Order: CRITICAL > WARNING > INFO (> anything else). One stable bucketing
+    # pass, so alerts keep rule order within a level, as the former sort did
+    buckets = {level: [] for level in _LEVEL_ORDER}
+    other = []
+    for a in alerts:
+        buckets.get(a.level, other).append(a)
 
-    return alerts
+    ordered = [a for level in _LEVEL_ORDER for a in buckets[level]]
+    ordered.extend(other)
+    return ordered
 
 
 # ---------------------------------------------------------------------------
@@ -204,6 +213,8 @@ def _check_review_dates(positions: List[Position], stale_days: int = 30) -> List
     """Rule 7: positions not reviewed in 30+ days."""
     alerts = []
     now = datetime.now()
+    # (now - last_review).days > stale_days  <=>  last_review <= cutoff
+    cutoff = now - timedelta(days=stale_days + 1)
 
     for p in positions:
         if not p.last_review_date:
@@ -216,9 +227,9 @@ def _check_review_dates(positions: List[Position], stale_days: int = 30) -> List
             continue
 
         try:
-            last_review = datetime.strptime(p.last_review_date, "%Y-%m-%d")
-            days_since = (now - last_review).days
-            if days_since > stale_days:
+            last_review = _parse_review_date(p.last_review_date)
+            if last_review <= cutoff:
+                days_since = (now - last_review).days
                 alerts.append(Alert(
                     level=AlertLevel.INFO,
                     rule_name="stale_review",
@@ -232,3 +243,19 @@ def _check_review_dates(positions: List[Position], stale_days: int = 30) -> List
             pass  # Malformed date, skip
 
     return alerts
+
+
+def _parse_review_date(value: str) -> datetime:
+    """
+    Parse a YYYY-MM-DD review date; raises ValueError if malformed.
+
+    Zero-padded dates take the datetime.fromisoformat fast path. Anything else
+    goes through strptime, so inputs fromisoformat would also accept (ISO week
+    dates, times, basic format) are still rejected exactly as before.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, "%Y-%m-%d")
@@ -5,25 +5,47 @@ Reads holdings from portfolio/holdings/ and profiles from Data Desk.
 Provides sector, industry, bucket, and geography breakdowns.
 Includes OPRMS-aware position limit checks and optional correlation adjustment.
 """
-import json
+import functools
 import logging
 import math
 from pathlib import Path
 from typing import List, Dict, Optional
 
+import numpy as np
+
 from portfolio.holdings.schema import Position, OPRMS_DNA_LIMITS
+from src.json_codec import json_loads
 
 logger = logging.getLogger(__name__)
 
 _PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+# Parsed profiles.json shared by every analyzer in the process:
+# {str(path): (st_mtime_ns, st_size, profiles)}. A changed file is re-parsed.
+# Profiles are only read (by_geography), never mutated.
+_PROFILES_CACHE: Dict[str, tuple] = {}
+
 
 class ExposureAnalyzer:
-    """Analyze portfolio exposure across multiple dimensions."""
+    """
+    Analyze portfolio exposure across multiple dimensions.
+
+    An analyzer is a read-only view of the positions it was built with:
+    aggregations are computed on first use and the same dicts are returned
+    on later calls (callers must not mutate them).
+    """
 
     def __init__(self, positions: List[Position]):
         self.positions = positions
-        self._profiles = self._load_profiles()
+        # {field: aggregation}, filled by _aggregate / by_geography
+        self._aggregates: Dict[str, Dict[str, dict]] = {}
+        self._heuristic_corr_exposure: Optional[Dict[str, float]] = None
+        self._by_weight_desc: Optional[List[Position]] = None
+
+    @functools.cached_property
+    def _profiles(self) -> dict:
+        """Data Desk profiles, read on first use (only by_geography needs them)."""
+        return self._load_profiles()
 
     def by_sector(self) -> Dict[str, dict]:
         """
@@ -47,6 +69,10 @@ class ExposureAnalyzer:
         Aggregate exposure by company HQ country.
         Uses Data Desk profiles for country field.
         """
+        cached = self._aggregates.get("geography")
+        if cached is not None:
+            return cached
+
         result = {}
         for p in self.positions:
             profile = self._profiles.get(p.symbol, {})
@@ -59,7 +85,9 @@ class ExposureAnalyzer:
             result[country]["symbols"].append(p.symbol)
 
         # Sort by weight descending
-        return dict(sorted(result.items(), key=lambda x: -x[1]["weight"]))
+        result = dict(sorted(result.items(), key=lambda x: -x[1]["weight"]))
+        self._aggregates["geography"] = result
+        return result
 
     def single_position_check(self) -> List[dict]:
         """
@@ -129,6 +157,14 @@ class ExposureAnalyzer:
 
         return sorted(violations, key=lambda x: -x["weight"])
 
+    def positions_by_weight(self) -> List[Position]:
+        """Positions sorted by current weight, descending (sorted once per analyzer)."""
+        if self._by_weight_desc is None:
+            self._by_weight_desc = sorted(
+                self.positions, key=lambda p: -p.current_weight
+            )
+        return self._by_weight_desc
+
     def top_n_concentration(self, n: int = 3) -> dict:
         """
         Check if top N positions are overly concentrated.
@@ -136,10 +172,7 @@ class ExposureAnalyzer:
         Returns:
             {"top_n": N, "combined_weight": 0.XX, "positions": [...]}
         """
-        sorted_positions = sorted(
-            self.positions, key=lambda p: -p.current_weight
-        )
-        top = sorted_positions[:n]
+        top = self.positions_by_weight()[:n]
         combined = sum(p.current_weight for p in top)
         return {
             "top_n": n,
@@ -163,10 +196,16 @@ class ExposureAnalyzer:
         Returns:
             {"effective_positions": N.X, "diversification_ratio": 0.XX,
              "sector_detail": {...}}
+
+        The sector-heuristic result (no correlation_matrix) is computed once
+        per analyzer.
         """
         if not self.positions:
             return {"effective_positions": 0, "diversification_ratio": 0}
 
+        if not correlation_matrix and self._heuristic_corr_exposure is not None:
+            return self._heuristic_corr_exposure
+
         n = len(self.positions)
         weights = [p.current_weight for p in self.positions]
 
@@ -177,13 +216,10 @@ class ExposureAnalyzer:
             corr = self._sector_heuristic_corr()
 
         # Portfolio variance using correlation matrix
-        # sigma_p^2 = sum_i sum_j w_i * w_j * rho_ij
+        # sigma_p^2 = sum_i sum_j w_i * w_j * rho_ij = w @ C @ w
         # (simplified: assume all individual volatilities = 1 for diversification ratio)
-        port_variance = 0.0
-        for i in range(n):
-            for j in range(n):
-                rho = corr[i][j] if i < len(corr) and j < len(corr[i]) else (1.0 if i == j else 0.3)
-                port_variance += weights[i] * weights[j] * rho
+        w_vec = np.asarray(weights, dtype=np.float64)
+        port_variance = float(w_vec @ corr @ w_vec)
 
         # HHI for comparison
         hhi = sum(w ** 2 for w in weights)
@@ -193,20 +229,27 @@ class ExposureAnalyzer:
         effective_positions = 1.0 / port_variance if port_variance > 0 else n
         diversification_ratio = effective_positions / n if n > 0 else 0
 
-        return {
+        result = {
             "effective_positions": round(effective_positions, 2),
             "actual_positions": n,
             "diversification_ratio": round(diversification_ratio, 4),
             "hhi": round(hhi, 6),
             "portfolio_variance_proxy": round(port_variance, 6),
         }
+        if not correlation_matrix:
+            self._heuristic_corr_exposure = result
+        return result
 
     # -----------------------------------------------------------------------
     # Internal helpers
     # -----------------------------------------------------------------------
 
     def _aggregate(self, field: str) -> Dict[str, dict]:
-        """Generic aggregation by a Position field."""
+        """Generic aggregation by a Position field (memoized per analyzer)."""
+        cached = self._aggregates.get(field)
+        if cached is not None:
+            return cached
+
         result = {}
         for p in self.positions:
             key = getattr(p, field, "Unknown") or "Unknown"
@@ -217,58 +260,59 @@ class ExposureAnalyzer:
             result[key]["value"] += p.market_value
             result[key]["symbols"].append(p.symbol)
 
-        return dict(sorted(result.items(), key=lambda x: -x[1]["weight"]))
+        result = dict(sorted(result.items(), key=lambda x: -x[1]["weight"]))
+        self._aggregates[field] = result
+        return result
 
     def _load_profiles(self) -> dict:
-        """Load profiles from Data Desk."""
+        """Load profiles from Data Desk (parsed once per file version, see _PROFILES_CACHE)."""
         profiles_path = _PROJECT_ROOT / "data" / "fundamental" / "profiles.json"
-        if not profiles_path.exists():
+        try:
+            st = profiles_path.stat()
+        except FileNotFoundError:
             return {}
+
+        key = str(profiles_path)
+        cached = _PROFILES_CACHE.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
         try:
-            with open(profiles_path, "r") as f:
-                return json.load(f)
+            profiles = json_loads(profiles_path.read_bytes())
         except Exception as e:
             logger.warning(f"Failed to load profiles: {e}")
             return {}
+        _PROFILES_CACHE[key] = (st.st_mtime_ns, st.st_size, profiles)
+        return profiles
 
-    def _sector_heuristic_corr(self) -> List[List[float]]:
+    def _sector_heuristic_corr(self) -> np.ndarray:
         """
         Build a heuristic correlation matrix based on sectors.
         Same sector = 0.6, different sector = 0.2, self = 1.0
         """
-        n = len(self.positions)
-        sectors = [p.sector for p in self.positions]
-        corr = []
-        for i in range(n):
-            row = []
-            for j in range(n):
-                if i == j:
-                    row.append(1.0)
-                elif sectors[i] == sectors[j]:
-                    row.append(0.6)
-                else:
-                    row.append(0.2)
-            corr.append(row)
+        # Sector -> integer code, so the pairwise comparison is one broadcast
+        codes: Dict[str, int] = {}
+        sector_ids = np.fromiter(
+            (codes.setdefault(p.sector, len(codes)) for p in self.positions),
+            dtype=np.intp,
+            count=len(self.positions),
+        )
+        corr = np.where(sector_ids[:, None] == sector_ids[None, :], 0.6, 0.2)
+        np.fill_diagonal(corr, 1.0)
         return corr
 
     def _extract_corr_matrix(
         self, correlation_matrix: Dict[str, Dict[str, float]]
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """Extract correlation values for current positions from a symbol-keyed matrix."""
-        n = len(self.positions)
         symbols = [p.symbol for p in self.positions]
-        corr = []
-        for i in range(n):
-            row = []
-            for j in range(n):
-                if i == j:
-                    row.append(1.0)
-                else:
-                    val = (
-                        correlation_matrix
-                        .get(symbols[i], {})
-                        .get(symbols[j], 0.3)
-                    )
-                    row.append(val)
-            corr.append(row)
+        empty: Dict[str, float] = {}
+        corr = np.array(
+            [
+                [row.get(s, 0.3) for s in symbols]
+                for row in (correlation_matrix.get(s, empty) for s in symbols)
+            ],
+            dtype=np.float64,
+        )
+        np.fill_diagonal(corr, 1.0)
         return corr
@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from portfolio.holdings.schema import Position
 from portfolio.exposure.analyzer import ExposureAnalyzer
-from portfolio.exposure.alerts import run_all_checks, Alert
+from portfolio.exposure.alerts import run_all_checks, Alert, AlertLevel
 
 
 def generate_exposure_summary(positions: List[Position]) -> str:
@@ -43,12 +43,12 @@ def generate_exposure_summary(positions: List[Position]) -> str:
     lines.append("")
     lines.append("| Symbol | DNA | Weight | Max | Utilization | Bucket |")
     lines.append("|--------|-----|-------:|----:|------------:|--------|")
-    sorted_pos = sorted(positions, key=lambda p: -p.current_weight)
-    for p in sorted_pos[:10]:
-        util = (p.current_weight / p.max_weight * 100) if p.max_weight > 0 else 0
+    for p in analyzer.positions_by_weight()[:10]:
+        max_w = p.max_weight
+        util = (p.current_weight / max_w * 100) if max_w > 0 else 0
         lines.append(
             f"| {p.symbol} | {p.dna_rating} | "
-            f"{p.current_weight*100:.1f}% | {p.max_weight*100:.0f}% | "
+            f"{p.current_weight*100:.1f}% | {max_w*100:.0f}% | "
             f"{util:.0f}% | {p.investment_bucket} |"
         )
     lines.append("")
@@ -115,9 +115,13 @@ def generate_concentration_report(positions: List[Position]) -> str:
     lines.append("")
 
     # Alert summary
-    critical = [a for a in alerts if a.level.value == "CRITICAL"]
-    warnings = [a for a in alerts if a.level.value == "WARNING"]
-    infos = [a for a in alerts if a.level.value == "INFO"]
+    # One pass, bucketed by level (AlertLevel is a str enum: members hash as their values)
+    by_level = {level: [] for level in AlertLevel}
+    for a in alerts:
+        by_level[a.level].append(a)
+    critical = by_level[AlertLevel.CRITICAL]
+    warnings = by_level[AlertLevel.WARNING]
+    infos = by_level[AlertLevel.INFO]
 
     lines.append("## Alert Summary")
     lines.append("")
@@ -154,7 +158,7 @@ def generate_concentration_report(positions: List[Position]) -> str:
     lines.append("")
     lines.append("| Symbol | DNA | Weight | Max | Utilization | Status |")
     lines.append("|--------|-----|-------:|----:|------------:|--------|")
-    for p in sorted(positions, key=lambda p: -p.current_weight):
+    for p in analyzer.positions_by_weight():
         max_w = p.max_weight
         util = (p.current_weight / max_w) if max_w > 0 else 0
         if util >= 1.0:
@@ -165,7 +169,7 @@ def generate_concentration_report(positions: List[Position]) -> str:
             status = "OK"
         lines.append(
             f"| {p.symbol} | {p.dna_rating} | "
-            f"{p.current_weight*100:.1f}% | {p.max_weight*100:.0f}% | "
+            f"{p.current_weight*100:.1f}% | {max_w*100:.0f}% | "
             f"{util*100:.0f}% | {status} |"
         )
     lines.append("")
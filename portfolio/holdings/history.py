@@ -2,16 +2,24 @@
 Position history — audit trail for all position changes.
 
 Every mutation to holdings is logged here with timestamp, action type, and details.
+
+Entries are appended to history.jsonl (one JSON object per line), so logging a
+change never re-reads or rewrites earlier entries. Entries from the original
+history.json array file are still read, ahead of the JSON-Lines log.
 """
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
+
+from src.json_codec import json_loads
 
 logger = logging.getLogger(__name__)
 
-_HISTORY_FILE = Path(__file__).parent / "history.json"
+_HISTORY_FILE = Path(__file__).parent / "history.jsonl"
+# Pre-JSON-Lines history (a single JSON array); read-only
+_LEGACY_HISTORY_FILE = Path(__file__).parent / "history.json"
 
 
 # Action types
@@ -30,15 +38,13 @@ def log_position_change(symbol: str, action: str, details: dict) -> None:
     if action not in ACTIONS:
         logger.warning(f"Unknown action '{action}' for {symbol}, logging anyway")
 
-    history = _load_history()
     entry = {
         "timestamp": datetime.now().isoformat(),
         "symbol": symbol.upper(),
         "action": action,
         "details": details,
     }
-    history.append(entry)
-    _save_history(history)
+    _append_history(entry)
     logger.info(f"History: {symbol} {action}")
 
 
@@ -57,17 +63,24 @@ def get_position_history(symbol: Optional[str] = None) -> List[dict]:
 
 
 def get_recent_history(days: int = 30) -> List[dict]:
-    """Get history entries from the last N days."""
-    history = _load_history()
+    """
+    Get history entries from the last N days.
+
+    The log is append-only and written in time order, so it is scanned from the
+    newest entry backwards and stops at the first entry older than the cutoff;
+    older lines are never JSON-decoded.
+    """
     cutoff = datetime.now().timestamp() - (days * 86400)
     result = []
-    for h in history:
+    for h in _iter_history_newest_first():
         try:
             ts = datetime.fromisoformat(h["timestamp"]).timestamp()
-            if ts >= cutoff:
-                result.append(h)
         except (KeyError, ValueError):
             continue
+        if ts < cutoff:
+            break
+        result.append(h)
+    result.reverse()
     return result
 
 
@@ -76,19 +89,62 @@ def get_recent_history(days: int = 30) -> List[dict]:
 # ---------------------------------------------------------------------------
 
 def _load_history() -> List[dict]:
-    """Load history from JSON file."""
+    """Load history: legacy JSON array entries first, then the JSON-Lines log."""
+    history = _load_legacy_history()
+    for line_no, line in enumerate(_read_history_lines(), 1):
+        entry = _parse_history_line(line, line_no)
+        if entry is not None:
+            history.append(entry)
+    return history
+
+
+def _iter_history_newest_first() -> Iterator[dict]:
+    """Yield history entries newest first, decoding lines only as they are reached."""
+    lines = _read_history_lines()
+    for line_no in range(len(lines), 0, -1):
+        entry = _parse_history_line(lines[line_no - 1], line_no)
+        if entry is not None:
+            yield entry
+    yield from reversed(_load_legacy_history())
+
+
+def _read_history_lines() -> List[str]:
+    """Raw lines of the JSON-Lines log ([] if missing or unreadable)."""
     if not _HISTORY_FILE.exists():
         return []
     try:
-        with open(_HISTORY_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, Exception) as e:
+        with open(_HISTORY_FILE, "r", encoding="utf-8") as f:
+            return f.readlines()
+    except Exception as e:
         logger.error(f"Failed to load history: {e}")
         return []
 
 
-def _save_history(history: List[dict]) -> None:
-    """Persist history to JSON file."""
+def _parse_history_line(line: str, line_no: int) -> Optional[dict]:
+    """Decode one log line; None for blank or malformed lines."""
+    if not line.strip():
+        return None
+    try:
+        return json_loads(line)
+    except json.JSONDecodeError as e:
+        # A torn final write only loses that line, not the whole log
+        logger.error(f"Skipping malformed history line {line_no}: {e}")
+        return None
+
+
+def _load_legacy_history() -> List[dict]:
+    """Load entries from the pre-JSON-Lines history.json array, if present."""
+    if not _LEGACY_HISTORY_FILE.exists():
+        return []
+    try:
+        return json_loads(_LEGACY_HISTORY_FILE.read_bytes())
+    except (json.JSONDecodeError, Exception) as e:
+        logger.error(f"Failed to load legacy history: {e}")
+        return []
+
+
+def _append_history(entry: dict) -> None:
+    """Append one entry to the JSON-Lines history log."""
     _HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(_HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=2, ensure_ascii=False)
+    with open(_HISTORY_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
@@ -5,6 +5,7 @@ Data is persisted as JSON in portfolio/holdings/.
 Reads price data from Data Desk (data/price/*.csv) for price refresh.
 Reads profiles from Data Desk (data/fundamental/profiles.json) for metadata.
 """
+import functools
 import json
 import logging
 from datetime import datetime
@@ -160,20 +161,24 @@ def get_positions_by_bucket(bucket: InvestmentBucket) -> List[Position]:
 # OPRMS Sizing
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=64)
 def calculate_target_weight(dna_rating: str, timing_rating: str) -> float:
     """
     OPRMS position sizing formula:
         target_weight = DNA_limit * Timing_coefficient
 
     Uses midpoint of timing range as default coefficient.
+    Memoized: the inputs are a handful of rating letters and the OPRMS
+    tables are fixed at import.
     """
     dna_limit = OPRMS_DNA_LIMITS.get(dna_rating, 0.02)
     timing_coeff = OPRMS_TIMING_DEFAULTS.get(timing_rating, 0.2)
     return round(dna_limit * timing_coeff, 4)
 
 
+@functools.lru_cache(maxsize=64)
 def calculate_target_weight_range(dna_rating: str, timing_rating: str) -> tuple:
-    """Return (min_weight, max_weight) based on OPRMS timing range."""
+    """Return (min_weight, max_weight) based on OPRMS timing range (memoized)."""
     dna_limit = OPRMS_DNA_LIMITS.get(dna_rating, 0.02)
     lo, hi = OPRMS_TIMING_COEFFICIENTS.get(timing_rating, (0.1, 0.3))
     return (round(dna_limit * lo, 4), round(dna_limit * hi, 4))
@@ -28,7 +28,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from config.settings import (
     DATA_DIR, SCANS_DIR,
     THEME_TOP_N, THEME_MAX_NEW_TICKERS, THEME_RS_THRESHOLD,
-    THEME_KEYWORDS_SEED,
+    THEME_KEYWORDS_SEED, TICKER_TO_THEMES,
 )
 from src.data import get_symbols
 from src.indicators.engine import run_all_indicators, get_indicator_summary, run_momentum_scan
@@ -191,10 +191,17 @@ def match_themes(
     Returns:
         {"ai_chip": ["NVDA", "AMD"], "memory": ["MU"], ...}
     """
+    ticker_set = set(t.upper() for t in tickers)
+
     if seed is None:
-        seed = THEME_KEYWORDS_SEED
+        # 默认种子走倒排索引: O(tickers) 而不是逐主题求交集
+        hits: Dict[str, List[str]] = {}
+        for ticker in ticker_set:
+            for theme_name in TICKER_TO_THEMES.get(ticker, ()):
+                hits.setdefault(theme_name, []).append(ticker)
+        # 保持种子中的主题顺序
+        return {name: sorted(hits[name]) for name in THEME_KEYWORDS_SEED if name in hits}
 
-    ticker_set = set(t.upper() for t in tickers)
     theme_map = {}
 
     for theme_name, info in seed.items():
@@ -0,0 +1,28 @@
+"""
+JSON codec shared by the on-disk readers and writers.
+
+orjson is an optional dependency (see requirements.txt); when it is not
+installed everything falls back to the stdlib json module. orjson.JSONDecodeError
+subclasses json.JSONDecodeError, so callers only need to catch the latter.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(raw: str | bytes):
+    """
+    json.loads semantics with the orjson fast path when it is installed.
+
+    orjson rejects a few inputs the stdlib accepts (NaN/Infinity literals,
+    integers beyond 64 bits); those are retried with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
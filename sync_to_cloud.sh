@@ -22,7 +22,9 @@ sync_code() {
         --exclude '__pycache__' \
         --exclude '*.pyc' \
         "$LOCAL_DIR/scripts/" "$REMOTE/scripts/"
-    rsync -avz "$LOCAL_DIR/config/settings.py" "$REMOTE/config/"
+    rsync -avz "$LOCAL_DIR/config/settings.py" \
+        "$LOCAL_DIR/config/themes.py" "$LOCAL_DIR/config/themes.json" \
+        "$REMOTE/config/"
 
     # 分析引擎
     rsync -avz --delete \
@@ -11,6 +11,7 @@ Plus composite Z-score ranking.
 import logging
 import math
 import re
+import sys
 import time
 from collections import Counter, defaultdict
 from datetime import date, datetime, timedelta
@@ -44,19 +45,21 @@ def extract_tickers(
     if not text:
         return []
 
-    blacklist = blacklist or set()
+    blacklist = blacklist or frozenset()
     found: Set[str] = set()
 
+    # Intern matched symbols so blacklist / known_tickers probes hit the
+    # identity fast path against the interned config constants.
     # Pass 1: $TICKER patterns (always trusted)
     for match in _DOLLAR_TICKER_RE.finditer(text):
-        sym = match.group(1)
+        sym = sys.intern(match.group(1))
         if sym not in blacklist:
             found.add(sym)
 
     # Pass 2: bare uppercase — only if we have a known set to validate against
     if known_tickers:
         for match in _BARE_TICKER_RE.finditer(text):
-            sym = match.group(1)
+            sym = sys.intern(match.group(1))
             if sym in known_tickers and sym not in blacklist:
                 found.add(sym)
 
@@ -9,7 +9,6 @@ Expiry: 4h trading days, 12h non-trading days
 """
 import json
 import logging
-import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -35,8 +34,9 @@ FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 # ---------------------------------------------------------------------------
 
 def _get_api_key() -> Optional[str]:
-    """Get FRED API key from environment."""
-    return os.getenv("FRED_API_KEY")
+    """Get FRED API key from environment (falls back to the project .env)."""
+    from config.settings import get_env
+    return get_env("FRED_API_KEY") or None
 
 
 def _fetch_series(series_id: str, limit: int = 60) -> List[Dict]:
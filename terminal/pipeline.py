@@ -729,10 +729,12 @@ def prepare_alpha_prompts(
         l1_key_forces: 3 key forces from L1 debate
         l1_oprms: Current OPRMS rating dict (or None)
     """
+    from knowledge.alpha.base import LENSES_BY_PHASE
     from knowledge.alpha.red_team import generate_red_team_prompt
     from knowledge.alpha.cycle_pendulum import generate_cycle_prompt
     from knowledge.alpha.asymmetric_bet import generate_bet_prompt
 
+    red_team, cycle, bet = LENSES_BY_PHASE[1], LENSES_BY_PHASE[2], LENSES_BY_PHASE[3]
     data_context = data_package.format_context()
     sector = ""
     if data_package.info:
@@ -752,16 +754,16 @@ def prepare_alpha_prompts(
     prompts = [
         {
             "phase": 1,
-            "phase_cn": "红队试炼",
-            "name": "Red Team Gauntlet",
+            "phase_cn": red_team.name_cn,
+            "name": red_team.name,
             "sequence": "A",
             "prompt": red_team_prompt,
             "depends_on": None,
         },
         {
             "phase": 2,
-            "phase_cn": "周期钟摆定位",
-            "name": "Cycle & Pendulum",
+            "phase_cn": cycle.name_cn,
+            "name": cycle.name,
             "sequence": "B",
             "prompt": None,  # Deferred — needs red_team_summary
             "depends_on": "A",
@@ -776,8 +778,8 @@ def prepare_alpha_prompts(
         },
         {
             "phase": 3,
-            "phase_cn": "非对称赌注",
-            "name": "Asymmetric Bet",
+            "phase_cn": bet.name_cn,
+            "name": bet.name,
             "sequence": "C",
             "prompt": None,  # Deferred — needs red_team + cycle summaries
             "depends_on": "B",
@@ -3,10 +3,10 @@ FMP (Financial Modeling Prep) tool wrappers.
 
 Each tool wraps a method from src/data/fmp_client.py, following the FinanceTool protocol.
 """
-import os
 import logging
 from typing import Any, Dict, List, Optional
 
+from config.settings import get_env
 from terminal.tools.protocol import (
     FinanceTool,
     ToolCategory,
@@ -37,7 +37,7 @@ class BaseFMPTool(FinanceTool):
         if not self._api_key_checked:
             self._is_available = (
                 FMP_CLIENT_AVAILABLE
-                and os.getenv("FMP_API_KEY") is not None
+                and bool(get_env("FMP_API_KEY"))
             )
             self._api_key_checked = True
         return self._is_available
@@ -9,13 +9,13 @@ FRED API 完全免费，提供美联储官方经济数据。
 3. 申请 API Key (即时批准)
 4. 添加到 .env: FRED_API_KEY=your_key_here
 """
-import os
 import logging
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
 import requests
 
+from config.settings import get_env
 from terminal.tools.protocol import (
     FinanceTool,
     ToolCategory,
@@ -38,7 +38,7 @@ class BaseFREDTool(FinanceTool):
     def is_available(self) -> bool:
         """检查 FRED API Key 是否存在"""
         if not self._api_key_checked:
-            self._is_available = os.getenv("FRED_API_KEY") is not None
+            self._is_available = bool(get_env("FRED_API_KEY"))
             self._api_key_checked = True
         return self._is_available
 
@@ -62,7 +62,7 @@ class BaseFREDTool(FinanceTool):
                 "Set FRED_API_KEY in .env file."
             )
 
-        api_key = os.getenv("FRED_API_KEY")
+        api_key = get_env("FRED_API_KEY")
 
         params = {
             "series_id": series_id,
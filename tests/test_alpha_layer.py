@@ -189,6 +189,22 @@ class TestAlphaPackage:
         assert restored.noise_to_ignore == original.noise_to_ignore
         assert restored.real_danger_signals == original.real_danger_signals
 
+    def test_to_bytes_roundtrip(self):
+        """to_bytes emits JSON that from_dict can restore (orjson or stdlib)."""
+        original = AlphaPackage(symbol="TSLA", action="执行", noise_to_ignore=["deliveries"])
+        raw = original.to_bytes()
+        assert isinstance(raw, bytes)
+        assert "执行".encode("utf-8") in raw
+        restored = AlphaPackage.from_dict(json.loads(raw))
+        assert restored == original
+
+    def test_to_bytes_stdlib_fallback(self):
+        """Without orjson the stdlib encoder produces the same document."""
+        pkg = AlphaPackage(symbol="TSLA", pendulum_score=7)
+        with patch("knowledge.alpha.base.orjson", None):
+            raw = pkg.to_bytes()
+        assert json.loads(raw) == pkg.to_dict()
+
     def test_from_dict_with_missing_keys(self):
         """from_dict handles missing keys gracefully."""
         d = {"symbol": "AAPL"}
@@ -198,6 +214,13 @@ class TestAlphaPackage:
         assert pkg.pendulum_score is None
         assert pkg.action == ""
 
+    def test_from_dict_defaults_not_shared(self):
+        """List defaults are fresh per instance, not one shared object."""
+        a = AlphaPackage.from_dict({})
+        b = AlphaPackage.from_dict({})
+        a.noise_to_ignore.append("x")
+        assert b.noise_to_ignore == []
+
     def test_from_dict_empty(self):
         """from_dict handles empty dict."""
         pkg = AlphaPackage.from_dict({})
@@ -431,6 +454,22 @@ class TestAsymmetricBetPrompt:
         )
         assert "无现有 OPRMS" in prompt
 
+    def test_oprms_with_unhashable_extras(self):
+        """Full rating dicts (with evidence lists) still render via the cache."""
+        kwargs = dict(
+            symbol="NVDA",
+            data_context=_sample_data_context(),
+            red_team_summary="test",
+            cycle_summary="test",
+            l1_oprms={"dna": "S", "timing": "A", "evidence": ["10-K", "call"]},
+            l1_verdict="BUY",
+            current_price=880.50,
+        )
+        first = generate_bet_prompt(**kwargs)
+        assert "DNA: S" in first
+        assert "时机系数: N/A" in first
+        assert generate_bet_prompt(**kwargs) is first
+
     def test_injects_current_price(self):
         prompt = generate_bet_prompt(
             symbol="NVDA",
@@ -0,0 +1,73 @@
+"""Tests for memo completeness checks (whole-word section markers)."""
+import pytest
+
+from knowledge.memo.scorer import _contains_word, check_completeness
+
+
+class TestContainsWord:
+    def test_thesis_not_matched_inside_synthesis(self):
+        assert _contains_word("final synthesis of the debate", "thesis") is False
+        assert _contains_word("synthesis; then the thesis", "thesis") is True
+
+    @pytest.mark.parametrize("text, marker", [
+        ("several valuations were run", "valuation"),
+        ("as evidenced by margins", "evidence"),
+        ("tensions", "tension 1"),
+        ("thesis_v2", "thesis"),
+        ("thesis2", "thesis"),
+    ])
+    def test_longer_words_do_not_count(self, text, marker):
+        assert _contains_word(text, marker) is False
+
+    @pytest.mark.parametrize("text", [
+        "thesis",
+        "## thesis\n",
+        "(thesis)",
+        "thesis-driven",
+        "the thesis.",
+    ])
+    def test_punctuation_and_edges_are_boundaries(self, text):
+        assert _contains_word(text, "thesis") is True
+
+    @pytest.mark.parametrize("text, marker", [
+        ("投资thesis论点", "thesis"),
+        ("## valuation估值", "valuation"),
+        ("核心evidence：", "evidence"),
+        ("executive summary摘要", "executive summary"),
+    ])
+    def test_cjk_next_to_marker_is_a_boundary(self, text, marker):
+        assert _contains_word(text, marker) is True
+
+    def test_cjk_does_not_rescue_partial_match(self):
+        assert _contains_word("综合synthesis分析", "thesis") is False
+
+
+class TestCheckCompleteness:
+    def test_plurals_and_substrings_do_not_mark_sections(self):
+        result = check_completeness(
+            "Synthesis of views. Several valuations were considered, "
+            "as evidenced by the data."
+        )
+        assert result["thesis"] is False
+        assert result["valuation"] is False
+        assert result["evidence"] is False
+
+    def test_mixed_chinese_english_memo(self):
+        memo = (
+            "## Executive Summary 执行摘要\n"
+            "## Variant View 差异观点\n"
+            "## 投资Thesis\n"
+            "## Evidence证据\n"
+            "## Valuation估值\n"
+            "## Key Analytical Tensions\n"
+            "## Risk Framework风险框架\n"
+            "## Action Plan行动计划\n"
+        )
+        assert all(check_completeness(memo).values())
+
+    def test_missing_sections_reported(self):
+        result = check_completeness("## Executive Summary\n## Valuation\n")
+        assert result["executive_summary"] is True
+        assert result["valuation"] is True
+        assert result["thesis"] is False
+        assert result["action_plan"] is False
@@ -0,0 +1,125 @@
+"""Tests for OPRMS ratings persistence (parsed-file cache) and the sensitivity table."""
+import pytest
+
+from knowledge.oprms import ratings as ratings_mod
+from knowledge.oprms.models import DNARating, OPRMSRating, TimingRating
+from knowledge.oprms.ratings import (
+    calculate_position_size,
+    generate_sensitivity_table,
+    load_ratings,
+    save_ratings,
+)
+
+
+def _rating(symbol, dna="A", timing="B", evidence=None):
+    return OPRMSRating(
+        symbol=symbol,
+        dna=DNARating(dna),
+        timing=TimingRating(timing),
+        timing_coeff=TimingRating(timing).midpoint,
+        evidence=list(evidence or []),
+        investment_bucket="Long-term Compounder",
+        updated_at="2025-01-01T00:00:00",
+    )
+
+
+@pytest.fixture
+def ratings_path(tmp_path):
+    path = tmp_path / "ratings.json"
+    save_ratings({
+        "AAPL": _rating("AAPL", evidence=["moat"]),
+        "NVDA": _rating("NVDA", dna="S", timing="A"),
+    }, path)
+    yield path
+    ratings_mod._RATINGS_CACHE.pop(str(path), None)
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Count how many times a ratings file is JSON-decoded."""
+    calls = []
+    real_loads = ratings_mod.json_loads
+
+    def counting_loads(raw):
+        calls.append(raw)
+        return real_loads(raw)
+
+    monkeypatch.setattr(ratings_mod, "json_loads", counting_loads)
+    return calls
+
+
+class TestRatingsCache:
+    def test_unchanged_file_is_parsed_once(self, ratings_path, decode_calls):
+        first = load_ratings(ratings_path)
+        second = load_ratings(ratings_path)
+
+        assert len(decode_calls) == 1
+        assert first == second
+        assert first["AAPL"].evidence == ["moat"]
+        assert second["NVDA"].dna is DNARating.S
+
+    def test_returned_ratings_are_independent_copies(self, ratings_path, decode_calls):
+        first = load_ratings(ratings_path)
+        first["AAPL"].evidence.append("mutated")
+        first["AAPL"].timing_coeff = 0.0
+        first["AAPL"].investment_bucket = "Short"
+        del first["NVDA"]
+
+        second = load_ratings(ratings_path)
+        assert len(decode_calls) == 1
+        assert second["AAPL"].evidence == ["moat"]
+        assert second["AAPL"].timing_coeff == TimingRating.B.midpoint
+        assert second["AAPL"].investment_bucket == "Long-term Compounder"
+        assert set(second) == {"AAPL", "NVDA"}
+        assert second["AAPL"] is not first["AAPL"]
+
+    def test_save_ratings_invalidates_cache(self, ratings_path, decode_calls):
+        loaded = load_ratings(ratings_path)
+        loaded["AAPL"] = _rating("AAPL", dna="B", timing="C", evidence=["downgrade"])
+        save_ratings(loaded, ratings_path)
+
+        reloaded = load_ratings(ratings_path)
+        assert len(decode_calls) == 2
+        assert reloaded["AAPL"].dna is DNARating.B
+        assert reloaded["AAPL"].evidence == ["downgrade"]
+
+    def test_external_rewrite_is_detected(self, ratings_path, decode_calls):
+        load_ratings(ratings_path)
+        text = ratings_path.read_text(encoding="utf-8")
+        ratings_path.write_text(text.replace('"moat"', '"moat", "pricing power"'), encoding="utf-8")
+
+        assert load_ratings(ratings_path)["AAPL"].evidence == ["moat", "pricing power"]
+        assert len(decode_calls) == 2
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert load_ratings(tmp_path / "missing.json") == {}
+
+
+class TestSensitivityTable:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        ratings_mod._sensitivity_rows.cache_clear()
+        yield
+        ratings_mod._sensitivity_rows.cache_clear()
+
+    def test_cells_match_position_size(self):
+        table = generate_sensitivity_table(1_000_000)
+
+        assert set(table) == {d.value for d in DNARating}
+        for dna in DNARating:
+            assert set(table[dna.value]) == {t.value for t in TimingRating}
+            for timing in TimingRating:
+                cell = table[dna.value][timing.value]
+                size = calculate_position_size(1_000_000, dna, timing)
+                assert cell["target_pct"] == pytest.approx(size.target_position_pct * 100, abs=0.01)
+                assert cell["target_usd"] == pytest.approx(size.target_position_usd, abs=0.01)
+
+    def test_returned_tables_are_independent(self):
+        first = generate_sensitivity_table(1_000_000)
+        first["A"]["B"]["target_usd"] = -1
+        del first["S"]
+
+        second = generate_sensitivity_table(1_000_000)
+        assert ratings_mod._sensitivity_rows.cache_info().hits == 1
+        assert second["A"]["B"]["target_usd"] == pytest.approx(75_000)
+        assert "S" in second
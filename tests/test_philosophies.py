@@ -0,0 +1,54 @@
+"""Tests for the investment philosophy lenses (frozen, shared instances)."""
+import dataclasses
+import importlib
+
+import pytest
+
+from knowledge.philosophies import _LENS_MODULES
+from knowledge.philosophies.base import InvestmentLens, format_prompt, get_all_lenses
+
+
+def _all_lenses():
+    return [
+        importlib.import_module(f"knowledge.philosophies.{name}").get_lens()
+        for name in sorted(_LENS_MODULES)
+    ]
+
+
+@pytest.mark.parametrize("lens", _all_lenses(), ids=lambda lens: lens.name)
+def test_lens_is_hashable(lens):
+    assert isinstance(lens.key_questions, tuple)
+    assert isinstance(lens.tags, tuple)
+    assert hash(lens) == hash(dataclasses.replace(lens))
+    assert len({lens, dataclasses.replace(lens)}) == 1
+
+
+def test_lenses_usable_as_dict_keys():
+    lenses = get_all_lenses()
+    by_lens = {lens: lens.name for lens in lenses}
+    assert len(by_lens) == len(lenses)
+
+
+def test_shared_lens_cannot_be_mutated():
+    lens = get_all_lenses()[0]
+    with pytest.raises(AttributeError):
+        lens.key_questions.append("extra question")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        lens.key_questions = ("replaced",)
+
+
+def test_prompt_lists_key_questions():
+    lens = get_all_lenses()[0]
+    prompt = format_prompt(lens, "AAPL")
+    for i, question in enumerate(lens.key_questions, 1):
+        assert f"  {i}. {question}" in prompt
+
+
+def test_custom_lens_renders_and_hashes():
+    lens = InvestmentLens(
+        name="Test", philosophy="p", core_metric="m", horizon="h", persona="x",
+        key_questions=("q1", "q2"), analysis_framework="f",
+        prompt_template="{lens_name} {ticker}\n{key_questions}",
+    )
+    assert format_prompt(lens, "MSFT") == "Test MSFT\n  1. q1\n  2. q2"
+    assert hash(lens) == hash(dataclasses.replace(lens))
@@ -0,0 +1,164 @@
+"""Tests for the position history audit log (legacy JSON array + JSON-Lines log)."""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from portfolio.holdings import history
+
+
+@pytest.fixture
+def history_files(tmp_path, monkeypatch):
+    """Point both history files at a temp directory; returns (jsonl, legacy)."""
+    jsonl = tmp_path / "history.jsonl"
+    legacy = tmp_path / "history.json"
+    monkeypatch.setattr(history, "_HISTORY_FILE", jsonl)
+    monkeypatch.setattr(history, "_LEGACY_HISTORY_FILE", legacy)
+    return jsonl, legacy
+
+
+def _entry(symbol, timestamp, action="ADD"):
+    return {"timestamp": timestamp, "symbol": symbol, "action": action, "details": {}}
+
+
+def _write_jsonl(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+class TestLoadHistory:
+    def test_legacy_entries_come_first(self, history_files):
+        jsonl, legacy = history_files
+        legacy.write_text(json.dumps([
+            _entry("AAPL", "2025-01-01T10:00:00", "OPEN"),
+            _entry("MSFT", "2025-01-02T10:00:00", "OPEN"),
+        ]))
+        _write_jsonl(jsonl, [
+            json.dumps(_entry("AAPL", "2025-02-01T10:00:00", "TRIM")),
+            json.dumps(_entry("NVDA", "2025-02-02T10:00:00", "OPEN")),
+        ])
+
+        entries = history.get_position_history()
+        assert [(e["symbol"], e["action"]) for e in entries] == [
+            ("AAPL", "OPEN"), ("MSFT", "OPEN"), ("AAPL", "TRIM"), ("NVDA", "OPEN"),
+        ]
+        assert [e["action"] for e in history.get_position_history("aapl")] == ["OPEN", "TRIM"]
+
+    def test_malformed_and_blank_lines_are_skipped(self, history_files):
+        jsonl, _ = history_files
+        _write_jsonl(jsonl, [
+            json.dumps(_entry("AAPL", "2025-02-01T10:00:00")),
+            '{"timestamp": "2025-02-02T10:00:00", "symbol": "MS',
+            "",
+            json.dumps(_entry("NVDA", "2025-02-03T10:00:00")),
+        ])
+
+        assert [e["symbol"] for e in history.get_position_history()] == ["AAPL", "NVDA"]
+
+    def test_missing_files_give_empty_history(self, history_files):
+        assert history.get_position_history() == []
+
+    def test_log_appends_without_touching_legacy(self, history_files):
+        jsonl, legacy = history_files
+        legacy.write_text(json.dumps([_entry("AAPL", "2025-01-01T10:00:00", "OPEN")]))
+        legacy_before = legacy.read_text()
+
+        history.log_position_change("msft", "OPEN", {"shares": 10})
+        history.log_position_change("MSFT", "ADD", {"shares": 5})
+
+        assert legacy.read_text() == legacy_before
+        assert len(jsonl.read_text().splitlines()) == 2
+        entries = history.get_position_history()
+        assert [(e["symbol"], e["action"]) for e in entries] == [
+            ("AAPL", "OPEN"), ("MSFT", "OPEN"), ("MSFT", "ADD"),
+        ]
+        assert entries[-1]["details"] == {"shares": 5}
+
+
+def _full_scan_recent(days):
+    """Reference: the original filter over the fully loaded history."""
+    cutoff = datetime.now().timestamp() - (days * 86400)
+    result = []
+    for h in history._load_history():
+        try:
+            if datetime.fromisoformat(h["timestamp"]).timestamp() >= cutoff:
+                result.append(h)
+        except (KeyError, ValueError):
+            continue
+    return result
+
+
+def _days_ago(days):
+    return (datetime.now() - timedelta(days=days)).isoformat()
+
+
+class TestRecentHistory:
+    def test_matches_full_scan_in_chronological_order(self, history_files):
+        jsonl, legacy = history_files
+        legacy.write_text(json.dumps([
+            _entry("AAPL", _days_ago(400), "OPEN"),
+            _entry("MSFT", _days_ago(200), "OPEN"),
+        ]))
+        _write_jsonl(jsonl, [
+            json.dumps(_entry("AAPL", _days_ago(90))),
+            json.dumps({"symbol": "BAD", "action": "ADD"}),
+            json.dumps(_entry("NVDA", _days_ago(20), "OPEN")),
+            json.dumps(_entry("BAD", "not-a-date")),
+            json.dumps(_entry("MSFT", _days_ago(5), "TRIM")),
+            json.dumps(_entry("NVDA", _days_ago(1))),
+        ])
+
+        for days in (0, 3, 10, 30, 100, 300, 1000):
+            assert history.get_recent_history(days) == _full_scan_recent(days)
+
+        recent = history.get_recent_history(30)
+        assert [e["symbol"] for e in recent] == ["NVDA", "MSFT", "NVDA"]
+        assert recent == sorted(recent, key=lambda e: e["timestamp"])
+
+    def test_stops_before_decoding_older_lines(self, history_files, monkeypatch):
+        jsonl, legacy = history_files
+        legacy.write_text(json.dumps([_entry("AAPL", _days_ago(400), "OPEN")]))
+        _write_jsonl(jsonl, [json.dumps(_entry("OLD", _days_ago(100 - i))) for i in range(50)]
+                     + [json.dumps(_entry("NEW", _days_ago(2))),
+                        json.dumps(_entry("NEW", _days_ago(1)))])
+
+        decoded = []
+        real_loads = history.json_loads
+
+        def counting_loads(raw):
+            decoded.append(raw)
+            return real_loads(raw)
+
+        monkeypatch.setattr(history, "json_loads", counting_loads)
+        recent = history.get_recent_history(7)
+
+        assert [e["symbol"] for e in recent] == ["NEW", "NEW"]
+        # Two in-window lines plus the first older line that ends the scan;
+        # the remaining log lines and the legacy file are never decoded
+        assert len(decoded) == 3
+
+    def test_legacy_tail_included_when_window_reaches_it(self, history_files):
+        jsonl, legacy = history_files
+        legacy.write_text(json.dumps([
+            _entry("AAPL", _days_ago(60), "OPEN"),
+            _entry("MSFT", _days_ago(40), "OPEN"),
+            _entry("TSLA", _days_ago(25), "OPEN"),
+        ]))
+        _write_jsonl(jsonl, [
+            json.dumps(_entry("AAPL", _days_ago(10), "TRIM")),
+            json.dumps(_entry("TSLA", _days_ago(3), "CLOSE")),
+        ])
+
+        recent = history.get_recent_history(45)
+        assert [(e["symbol"], e["action"]) for e in recent] == [
+            ("MSFT", "OPEN"), ("TSLA", "OPEN"), ("AAPL", "TRIM"), ("TSLA", "CLOSE"),
+        ]
+        assert recent == _full_scan_recent(45)
+
+    def test_legacy_only(self, history_files):
+        _, legacy = history_files
+        legacy.write_text(json.dumps([
+            _entry("AAPL", _days_ago(50), "OPEN"),
+            _entry("MSFT", _days_ago(2), "OPEN"),
+        ]))
+
+        assert [e["symbol"] for e in history.get_recent_history(30)] == ["MSFT"]
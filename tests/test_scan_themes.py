@@ -260,6 +260,15 @@ class TestMatchThemes:
         assert "ai_chip" in result
         assert "NVDA" in result["ai_chip"]
 
+    def test_default_index_matches_seed_scan(self):
+        """Inverted-index path agrees with scanning the seed explicitly."""
+        from config.settings import THEME_KEYWORDS_SEED
+        tickers = ["NVDA", "msft", "MU", "TSLA", "AAPL", "ZZZZ"]
+        indexed = match_themes(tickers)
+        scanned = match_themes(tickers, seed=THEME_KEYWORDS_SEED)
+        assert indexed == scanned
+        assert list(indexed) == list(scanned)
+
 
 # ---------------------------------------------------------------------------
 # Tests: format_theme_report
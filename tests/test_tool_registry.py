@@ -24,7 +24,9 @@ from terminal.tools.fmp_tools import (
     GetQuoteTool,
     GetProfileTool,
     create_fmp_tools,
+    FMP_CLIENT_AVAILABLE,
 )
+from terminal.tools.fred_tools import GetVIXTool
 
 
 # ========== Mock Tool for Testing ==========
@@ -242,13 +244,20 @@ def test_fmp_tool_availability_with_api_key():
         # We're testing the env var check logic here
 
 
-def test_fmp_tool_availability_without_api_key():
+def test_fmp_tool_availability_without_api_key(tmp_path, monkeypatch):
     """Test FMP tool is unavailable when API key missing."""
-    with patch.dict(os.environ, {}, clear=True):
-        # Clear the cached availability check
-        tool = GetQuoteTool()
-        tool._api_key_checked = False
-        assert tool.is_available() is False
+    from config import settings
+
+    monkeypatch.setattr(settings, "_PROJECT_ROOT_STR", str(tmp_path))
+    settings._load_env.cache_clear()
+    try:
+        with patch.dict(os.environ, {}, clear=True):
+            # Clear the cached availability check
+            tool = GetQuoteTool()
+            tool._api_key_checked = False
+            assert tool.is_available() is False
+    finally:
+        settings._load_env.cache_clear()
 
 
 def test_fmp_tool_metadata():
@@ -263,6 +272,62 @@ def test_fmp_tool_metadata():
     assert meta.api_key_env_var == "FMP_API_KEY"
 
 
+# ========== FRED Tools Tests ==========
+
+@pytest.fixture
+def dotenv_only_api_keys(tmp_path, monkeypatch):
+    """FRED/FMP API keys only present in a project .env, not in the process env."""
+    from config import settings
+
+    (tmp_path / ".env").write_text("FRED_API_KEY=dotenv_key\nFMP_API_KEY=dotenv_fmp_key\n")
+    monkeypatch.setattr(settings, "_PROJECT_ROOT_STR", str(tmp_path))
+    monkeypatch.delenv("FRED_API_KEY", raising=False)
+    monkeypatch.delenv("FMP_API_KEY", raising=False)
+    monkeypatch.delenv(settings._DOTENV_LOADED_MARKER, raising=False)
+    settings._load_env.cache_clear()
+    yield
+    settings._load_env.cache_clear()
+    os.environ.pop("FRED_API_KEY", None)
+    os.environ.pop("FMP_API_KEY", None)
+    os.environ.pop(settings._DOTENV_LOADED_MARKER, None)
+
+
+def test_fred_tool_available_with_key_in_dotenv(dotenv_only_api_keys):
+    """FRED tool picks up FRED_API_KEY from .env when not in the environment."""
+    tool = GetVIXTool()
+    assert tool.is_available() is True
+
+
+def test_fred_tool_request_uses_key_from_dotenv(dotenv_only_api_keys):
+    """The request path sends the .env key as api_key."""
+    tool = GetVIXTool()
+    response = Mock()
+    response.json.return_value = {"observations": []}
+    with patch("terminal.tools.fred_tools.requests.get", return_value=response) as get:
+        tool._fetch_series("VIXCLS", limit=1)
+    assert get.call_args.kwargs["params"]["api_key"] == "dotenv_key"
+
+
+def test_fred_tool_unavailable_without_key(tmp_path, monkeypatch):
+    """FRED tool is unavailable when neither env nor .env has the key."""
+    from config import settings
+
+    monkeypatch.setattr(settings, "_PROJECT_ROOT_STR", str(tmp_path))
+    monkeypatch.delenv("FRED_API_KEY", raising=False)
+    settings._load_env.cache_clear()
+    try:
+        assert GetVIXTool().is_available() is False
+    finally:
+        settings._load_env.cache_clear()
+
+
+@pytest.mark.skipif(not FMP_CLIENT_AVAILABLE, reason="FMP client not importable")
+def test_fmp_tool_available_with_key_in_dotenv(dotenv_only_api_keys):
+    """FMP tools pick up FMP_API_KEY from .env when not in the environment."""
+    assert GetQuoteTool().is_available() is True
+    assert GetProfileTool().is_available() is True
+
+
 # ========== Integration Tests ==========
 
 def test_global_registry_initialization():